@@ -0,0 +1,132 @@
+package jsonhandler
+
+import (
+	"container/list"
+	"sync"
+	"time"
+)
+
+// parseCacheCapacity bounds how many parsed files are kept across handlers
+const parseCacheCapacity = 16
+
+// parseCacheEntry holds parsed data together with the file state it was read
+// from. An entry with nil data records a file version that was streamed once
+// but never parsed.
+type parseCacheEntry struct {
+	key     string
+	data    map[string]interface{}
+	modTime time.Time
+	size    int64
+}
+
+// parseCache is a small LRU of parsed JSON documents shared by all handlers.
+// Every tool call creates a fresh JSONHandler, so a per-instance cache alone
+// never hits; this one survives between calls and is invalidated whenever the
+// file's modification time or size changes.
+type parseCache struct {
+	mutex    sync.Mutex
+	capacity int
+	order    *list.List
+	entries  map[string]*list.Element
+}
+
+// sharedParseCache is the process-wide cache used by LoadJSON and SaveJSON
+var sharedParseCache = newParseCache(parseCacheCapacity)
+
+// newParseCache creates an empty cache holding at most capacity files
+func newParseCache(capacity int) *parseCache {
+	return &parseCache{
+		capacity: capacity,
+		order:    list.New(),
+		entries:  make(map[string]*list.Element),
+	}
+}
+
+// get returns cached data for key if it was parsed from a file with the same
+// modification time and size
+func (c *parseCache) get(key string, modTime time.Time, size int64) (map[string]interface{}, bool) {
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+
+	element, ok := c.entries[key]
+	if !ok {
+		return nil, false
+	}
+
+	entry := element.Value.(*parseCacheEntry)
+	if !entry.modTime.Equal(modTime) || entry.size != size {
+		// Stale entry, the file changed on disk
+		c.order.Remove(element)
+		delete(c.entries, key)
+		return nil, false
+	}
+
+	if entry.data == nil {
+		return nil, false
+	}
+
+	c.order.MoveToFront(element)
+	return entry.data, true
+}
+
+// markStreamed records that the given version of the file behind key was
+// streamed instead of parsed. It reports false if that version was already
+// streamed or parsed, telling the caller to parse and cache it this time.
+func (c *parseCache) markStreamed(key string, modTime time.Time, size int64) bool {
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+
+	if element, ok := c.entries[key]; ok {
+		entry := element.Value.(*parseCacheEntry)
+		if entry.modTime.Equal(modTime) && entry.size == size {
+			return false
+		}
+	}
+
+	c.insertLocked(key, nil, modTime, size)
+	return true
+}
+
+// put stores data for key, evicting the least recently used file if full
+func (c *parseCache) put(key string, data map[string]interface{}, modTime time.Time, size int64) {
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+
+	c.insertLocked(key, data, modTime, size)
+}
+
+// insertLocked stores an entry for key; the caller must hold the mutex
+func (c *parseCache) insertLocked(key string, data map[string]interface{}, modTime time.Time, size int64) {
+	if element, ok := c.entries[key]; ok {
+		entry := element.Value.(*parseCacheEntry)
+		entry.data = data
+		entry.modTime = modTime
+		entry.size = size
+		c.order.MoveToFront(element)
+		return
+	}
+
+	c.entries[key] = c.order.PushFront(&parseCacheEntry{
+		key:     key,
+		data:    data,
+		modTime: modTime,
+		size:    size,
+	})
+
+	for c.order.Len() > c.capacity {
+		oldest := c.order.Back()
+		c.order.Remove(oldest)
+		delete(c.entries, oldest.Value.(*parseCacheEntry).key)
+	}
+}
+
+// remove drops any cached data for key
+func (c *parseCache) remove(key string) {
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+
+	if element, ok := c.entries[key]; ok {
+		c.order.Remove(element)
+		delete(c.entries, key)
+	}
+}
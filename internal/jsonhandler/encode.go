@@ -0,0 +1,193 @@
+package jsonhandler
+
+import (
+	"bytes"
+	"encoding/json"
+	"math"
+	"sort"
+	"strconv"
+	"unicode/utf8"
+)
+
+// maxDirectDepth is the nesting depth after which writeIndentedJSON hands
+// values to the encoder, which detects reference cycles
+const maxDirectDepth = 1000
+
+// writeIndentedJSON writes value to buf as indented JSON, byte for byte what
+// a json.Encoder with SetIndent(prefix, indent) and SetEscapeHTML(false)
+// produces, without the trailing newline. Decoded documents only contain
+// maps, slices, strings, float64, bool and nil, so those are written directly:
+// this skips the reflection walk and the separate indentation pass the
+// encoder makes over its compact output. Anything else, including strings and
+// numbers whose formatting differs between Go releases, goes through the
+// encoder.
+func writeIndentedJSON(buf *bytes.Buffer, value interface{}, prefix, indent string) error {
+	return writeIndentedValue(buf, value, prefix, indent, 0)
+}
+
+// writeIndentedValue is writeIndentedJSON for a value nested depth levels deep
+func writeIndentedValue(buf *bytes.Buffer, value interface{}, prefix, indent string, depth int) error {
+	if depth > maxDirectDepth {
+		return writeWithEncoder(buf, value, prefix, indent)
+	}
+
+	switch v := value.(type) {
+	case nil:
+		buf.WriteString("null")
+	case bool:
+		buf.WriteString(strconv.FormatBool(v))
+	case string:
+		if !writeSimpleString(buf, v) {
+			return writeWithEncoder(buf, v, prefix, indent)
+		}
+	case float64:
+		if !writeSimpleFloat(buf, v) {
+			return writeWithEncoder(buf, v, prefix, indent)
+		}
+	case map[string]interface{}:
+		if v == nil {
+			buf.WriteString("null")
+			return nil
+		}
+		if len(v) == 0 {
+			buf.WriteString("{}")
+			return nil
+		}
+
+		// encoding/json emits map keys in sorted order
+		keys := make([]string, 0, len(v))
+		for key := range v {
+			keys = append(keys, key)
+		}
+		sort.Strings(keys)
+
+		inner := prefix + indent
+		buf.WriteByte('{')
+		for i, key := range keys {
+			if i > 0 {
+				buf.WriteByte(',')
+			}
+			buf.WriteByte('\n')
+			buf.WriteString(inner)
+			if !writeSimpleString(buf, key) {
+				if err := writeWithEncoder(buf, key, inner, indent); err != nil {
+					return err
+				}
+			}
+			buf.WriteString(": ")
+			if err := writeIndentedValue(buf, v[key], inner, indent, depth+1); err != nil {
+				return err
+			}
+		}
+		buf.WriteByte('\n')
+		buf.WriteString(prefix)
+		buf.WriteByte('}')
+	case []interface{}:
+		if v == nil {
+			buf.WriteString("null")
+			return nil
+		}
+		if len(v) == 0 {
+			buf.WriteString("[]")
+			return nil
+		}
+
+		inner := prefix + indent
+		buf.WriteByte('[')
+		for i, item := range v {
+			if i > 0 {
+				buf.WriteByte(',')
+			}
+			buf.WriteByte('\n')
+			buf.WriteString(inner)
+			if err := writeIndentedValue(buf, item, inner, indent, depth+1); err != nil {
+				return err
+			}
+		}
+		buf.WriteByte('\n')
+		buf.WriteString(prefix)
+		buf.WriteByte(']')
+	default:
+		return writeWithEncoder(buf, v, prefix, indent)
+	}
+
+	return nil
+}
+
+// writeWithEncoder writes value using encoding/json at the given indentation
+func writeWithEncoder(buf *bytes.Buffer, value interface{}, prefix, indent string) error {
+	encoder := json.NewEncoder(buf)
+	encoder.SetEscapeHTML(false)
+	encoder.SetIndent(prefix, indent)
+	if err := encoder.Encode(value); err != nil {
+		return err
+	}
+
+	// Drop the newline Encode appends after every value
+	buf.Truncate(buf.Len() - 1)
+	return nil
+}
+
+// writeSimpleString writes s as a JSON string if it only needs the escapes
+// every Go release agrees on, and reports whether it did. Other control
+// characters, invalid UTF-8 and U+2028/U+2029 are left to the encoder.
+func writeSimpleString(buf *bytes.Buffer, s string) bool {
+	for i := 0; i < len(s); {
+		b := s[i]
+		if b < utf8.RuneSelf {
+			if b < 0x20 && b != '\n' && b != '\r' && b != '\t' {
+				return false
+			}
+			i++
+			continue
+		}
+
+		r, size := utf8.DecodeRuneInString(s[i:])
+		if r == utf8.RuneError && size == 1 || r == '\u2028' || r == '\u2029' {
+			return false
+		}
+		i += size
+	}
+
+	buf.WriteByte('"')
+	start := 0
+	for i := 0; i < len(s); i++ {
+		var escaped string
+		switch s[i] {
+		case '"':
+			escaped = `\"`
+		case '\\':
+			escaped = `\\`
+		case '\n':
+			escaped = `\n`
+		case '\r':
+			escaped = `\r`
+		case '\t':
+			escaped = `\t`
+		default:
+			continue
+		}
+		buf.WriteString(s[start:i])
+		buf.WriteString(escaped)
+		start = i + 1
+	}
+	buf.WriteString(s[start:])
+	buf.WriteByte('"')
+	return true
+}
+
+// writeSimpleFloat writes f the way encoding/json does when it uses plain
+// decimal notation, and reports whether it did. Exponent notation, NaN and
+// infinities are left to the encoder.
+func writeSimpleFloat(buf *bytes.Buffer, f float64) bool {
+	if math.IsNaN(f) || math.IsInf(f, 0) {
+		return false
+	}
+	if abs := math.Abs(f); abs != 0 && (abs < 1e-6 || abs >= 1e21) {
+		return false
+	}
+
+	var scratch [32]byte
+	buf.Write(strconv.AppendFloat(scratch[:0], f, 'f', -1, 64))
+	return true
+}
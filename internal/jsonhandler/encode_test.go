@@ -0,0 +1,74 @@
+package jsonhandler
+
+import (
+	"bytes"
+	"encoding/json"
+	"math"
+	"testing"
+)
+
+func TestWriteIndentedJSON(t *testing.T) {
+	tests := []struct {
+		name  string
+		value interface{}
+	}{
+		{"nested document", map[string]interface{}{
+			"title":  "Dashboard",
+			"nested": map[string]interface{}{"b": "2", "a": "1"},
+			"list":   []interface{}{"x", float64(1), true, nil, map[string]interface{}{}},
+			"empty":  []interface{}{},
+		}},
+		{"strings needing escapes", map[string]interface{}{
+			"quotes":             `say "hi" \ bye`,
+			"newlines":           "line1\nline2\r\n\ttabbed",
+			"html":               "<b>bold</b> & more",
+			"control":            "bell\u0007 backspace\b formfeed\f",
+			"separator":          "line\u2028para\u2029end",
+			"invalid":            "bad\xffbyte",
+			"unicode":            "こんにちは 🌍",
+			"key\"with\nescapes": "value",
+		}},
+		{"numbers", []interface{}{
+			float64(0), math.Copysign(0, -1), float64(42), 3.14, -2.5,
+			1e-7, 1e20, 1e21, 123456789012345680000.0, float64(1) / 3,
+		}},
+		{"non-decoded types", map[string]interface{}{
+			"int":    7,
+			"map":    map[string]string{"k": "v"},
+			"nilMap": map[string]interface{}(nil),
+			"nilArr": []interface{}(nil),
+			"nested": []interface{}{map[string]interface{}{"deep": []string{"a", "b"}}},
+		}},
+		{"scalar", "just a string"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			for _, prefix := range []string{"", "    "} {
+				var want bytes.Buffer
+				encoder := json.NewEncoder(&want)
+				encoder.SetEscapeHTML(false)
+				encoder.SetIndent(prefix, "  ")
+				if err := encoder.Encode(tt.value); err != nil {
+					t.Fatal(err)
+				}
+
+				var got bytes.Buffer
+				if err := writeIndentedJSON(&got, tt.value, prefix, "  "); err != nil {
+					t.Fatalf("writeIndentedJSON() error = %v", err)
+				}
+
+				if got.String() != string(bytes.TrimSuffix(want.Bytes(), []byte("\n"))) {
+					t.Errorf("writeIndentedJSON() with prefix %q =\n%s\nwant\n%s", prefix, got.String(), want.String())
+				}
+			}
+		})
+	}
+}
+
+func TestWriteIndentedJSONUnsupportedValue(t *testing.T) {
+	var buf bytes.Buffer
+	if err := writeIndentedJSON(&buf, map[string]interface{}{"nan": math.NaN()}, "", "  "); err == nil {
+		t.Error("writeIndentedJSON() expected error for NaN")
+	}
+}
@@ -0,0 +1,45 @@
+package jsonhandler
+
+import "sync"
+
+// fileLock serializes read-modify-write cycles on one file
+type fileLock struct {
+	mutex sync.Mutex
+	users int
+}
+
+// fileLocks holds a lock for every file with an update in progress. Entries
+// are reference counted and dropped when the last user unlocks.
+var (
+	fileLocks      = make(map[string]*fileLock)
+	fileLocksMutex sync.Mutex
+)
+
+// LockUpdates blocks until no other update to the same file is in progress
+// and returns the function that releases it. Tool calls may run concurrently,
+// so without it two writers could load the same version of a file and the
+// later save would drop the earlier one's change. Readers don't take the
+// lock: saves replace the file atomically and cached data is never mutated.
+func (h *JSONHandler) LockUpdates() func() {
+	fileLocksMutex.Lock()
+	lock, ok := fileLocks[h.cacheKey]
+	if !ok {
+		lock = &fileLock{}
+		fileLocks[h.cacheKey] = lock
+	}
+	lock.users++
+	fileLocksMutex.Unlock()
+
+	lock.mutex.Lock()
+
+	return func() {
+		lock.mutex.Unlock()
+
+		fileLocksMutex.Lock()
+		lock.users--
+		if lock.users == 0 {
+			delete(fileLocks, h.cacheKey)
+		}
+		fileLocksMutex.Unlock()
+	}
+}
@@ -1,11 +1,15 @@
 package jsonhandler
 
 import (
+	"bytes"
 	"encoding/json"
 	"errors"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
+	"runtime"
+	"strings"
 	"sync"
 	"time"
 )
@@ -19,11 +23,52 @@ var (
 	ErrUnknownError   = errors.New("UNKNOWN_ERROR")
 )
 
+// encodeBufferPool reuses serialization buffers across saves so large
+// translation files don't reallocate their output buffer on every write
+var encodeBufferPool = sync.Pool{
+	New: func() interface{} {
+		return new(bytes.Buffer)
+	},
+}
+
+// maxPooledBufferSize caps the buffers kept in encodeBufferPool. A save of a
+// very large file would otherwise pin a file-sized buffer in the pool long
+// after the write has finished.
+const maxPooledBufferSize = 4 << 20
+
+// putEncodeBuffer returns buf to the pool unless it grew past maxPooledBufferSize
+func putEncodeBuffer(buf *bytes.Buffer) {
+	if buf.Cap() > maxPooledBufferSize {
+		return
+	}
+	encodeBufferPool.Put(buf)
+}
+
+// readFileContents reads an open file whose size was taken from the same
+// descriptor into a single presized buffer. If the file shrank since the
+// size was read, the returned data is truncated rather than an error, and
+// the parse that follows reports it.
+func readFileContents(file *os.File, size int64) ([]byte, error) {
+	if size == 0 {
+		return nil, nil
+	}
+
+	data := make([]byte, size)
+	n, err := io.ReadFull(file, data)
+	if err != nil && err != io.ErrUnexpectedEOF {
+		return nil, err
+	}
+	return data[:n], nil
+}
+
 // JSONHandler handles JSON file operations with caching support
 type JSONHandler struct {
 	filePath   string
+	cacheKey   string
 	cachedData map[string]interface{}
 	fileMTime  time.Time
+	fileSize   int64
+	durable    bool
 	mutex      sync.RWMutex
 }
 
@@ -31,32 +76,91 @@ type JSONHandler struct {
 func NewJSONHandler(filePath string) *JSONHandler {
 	return &JSONHandler{
 		filePath: filePath,
+		cacheKey: resolveCacheKey(filePath),
 	}
 }
 
-// LoadJSON loads JSON data from file with optional caching
+// resolvedPathLimit bounds the number of interned cache keys
+const resolvedPathLimit = 1024
+
+// resolvedPaths interns the absolute form of every path a handler was created
+// for. Clients address the same few files on every call, and resolving a
+// relative path costs a getwd syscall each time.
+var (
+	resolvedPaths      = make(map[string]string)
+	resolvedPathsMutex sync.RWMutex
+)
+
+// resolveCacheKey returns the absolute path used to key shared state for
+// filePath, falling back to filePath itself if it cannot be resolved
+func resolveCacheKey(filePath string) string {
+	resolvedPathsMutex.RLock()
+	cacheKey, ok := resolvedPaths[filePath]
+	resolvedPathsMutex.RUnlock()
+	if ok {
+		return cacheKey
+	}
+
+	absPath, err := filepath.Abs(filePath)
+	if err != nil {
+		return filePath
+	}
+
+	resolvedPathsMutex.Lock()
+	if len(resolvedPaths) >= resolvedPathLimit {
+		resolvedPaths = make(map[string]string)
+	}
+	resolvedPaths[filePath] = absPath
+	resolvedPathsMutex.Unlock()
+
+	return absPath
+}
+
+// LoadJSON loads JSON data from file with optional caching. With useCache the
+// returned map may be the copy held in the process-wide parse cache, shared
+// with every other handler for the same file, so callers must treat it as
+// read-only; use LoadJSONForUpdate for data that will be modified. Without
+// useCache the file is parsed into a private map the caller owns.
 func (h *JSONHandler) LoadJSON(useCache bool) (map[string]interface{}, error) {
 	h.mutex.Lock()
 	defer h.mutex.Unlock()
 
-	// Check if file exists
-	fileInfo, err := os.Stat(h.filePath)
+	// Open first and stat the descriptor, so the cache key describes exactly
+	// the bytes that are read below
+	file, err := os.Open(h.filePath)
 	if os.IsNotExist(err) {
 		return nil, fmt.Errorf("%w: File %s not found", ErrFileNotFound, h.filePath)
 	}
+	if err != nil {
+		return nil, fmt.Errorf("%w: Failed to open %s: %v", ErrFileReadError, h.filePath, err)
+	}
+	defer file.Close()
+
+	fileInfo, err := file.Stat()
 	if err != nil {
 		return nil, fmt.Errorf("%w: Failed to stat %s: %v", ErrFileReadError, h.filePath, err)
 	}
 
 	currentMTime := fileInfo.ModTime()
+	currentSize := fileInfo.Size()
 
 	// Use cache if available and file hasn't changed
-	if useCache && h.cachedData != nil && h.fileMTime.Equal(currentMTime) {
+	if useCache && h.cachedData != nil && h.fileMTime.Equal(currentMTime) && h.fileSize == currentSize {
 		return h.cachedData, nil
 	}
 
+	// Fall back to data parsed by another handler for the same file
+	if useCache {
+		if cached, ok := sharedParseCache.get(h.cacheKey, currentMTime, currentSize); ok {
+			h.cachedData = cached
+			h.fileMTime = currentMTime
+			h.fileSize = currentSize
+			return cached, nil
+		}
+	}
+
 	// Read and parse file
-	data, err := os.ReadFile(h.filePath)
+	data, err := readFileContents(file, currentSize)
 	if err != nil {
 		return nil, fmt.Errorf("%w: Failed to read %s: %v", ErrFileReadError, h.filePath, err)
 	}
@@ -70,37 +174,119 @@ func (h *JSONHandler) LoadJSON(useCache bool) (map[string]interface{}, error) {
 	if useCache {
 		h.cachedData = jsonData
 		h.fileMTime = currentMTime
+		h.fileSize = currentSize
+		sharedParseCache.put(h.cacheKey, jsonData, currentMTime, currentSize)
 	}
 
 	return jsonData, nil
 }
 
+// StreamUncached passes a reader over the file to fn when the file is at least
+// minSize bytes and no parsed copy of its current contents is cached, so large
+// documents can be inspected without decoding them fully. Only the first read
+// of each file version is streamed; a repeat returns false so the caller
+// parses the file with LoadJSON and later reads are served from the cache.
+// It reports whether fn was called; failures to open the file are left for
+// LoadJSON to report.
+func (h *JSONHandler) StreamUncached(minSize int64, fn func(r io.Reader) error) (bool, error) {
+	return h.streamFile(minSize, true, fn)
+}
+
+// StreamFile passes a reader over the file to fn when the file is at least
+// minSize bytes, whether or not it is cached. It reports whether fn was called.
+func (h *JSONHandler) StreamFile(minSize int64, fn func(r io.Reader) error) (bool, error) {
+	return h.streamFile(minSize, false, fn)
+}
+
+// streamFile opens the file and hands it to fn if it is large enough
+func (h *JSONHandler) streamFile(minSize int64, skipCached bool, fn func(r io.Reader) error) (bool, error) {
+	file, err := os.Open(h.filePath)
+	if err != nil {
+		return false, nil
+	}
+	defer file.Close()
+
+	fileInfo, err := file.Stat()
+	if err != nil || fileInfo.Size() < minSize {
+		return false, nil
+	}
+
+	if skipCached && !sharedParseCache.markStreamed(h.cacheKey, fileInfo.ModTime(), fileInfo.Size()) {
+		return false, nil
+	}
+
+	return true, fn(file)
+}
+
 // SaveJSON saves JSON data to file with atomic write
 func (h *JSONHandler) SaveJSON(data map[string]interface{}, indent int) error {
 	h.mutex.Lock()
 	defer h.mutex.Unlock()
 
-	// Use atomic write - write to temp file then rename
+	return h.saveLocked(data, indent)
+}
+
+// saveLocked is SaveJSON for callers already holding the handler mutex
+func (h *JSONHandler) saveLocked(data map[string]interface{}, indent int) error {
+	// Encode JSON with indentation into a pooled buffer, then write it in one call
+	buf := encodeBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	defer putEncodeBuffer(buf)
+
+	if err := writeIndentedJSON(buf, data, "", getIndentString(indent)); err != nil {
+		return fmt.Errorf("%w: Failed to encode JSON: %v", ErrFileWriteError, err)
+	}
+	buf.WriteByte('\n')
+
+	err := h.replaceFile(func(tempFile *os.File) error {
+		if _, err := tempFile.Write(buf.Bytes()); err != nil {
+			return fmt.Errorf("%w: Failed to write temp file: %v", ErrFileWriteError, err)
+		}
+		return nil
+	})
+	if err != nil {
+		return err
+	}
+
+	h.refreshCache(data)
+	return nil
+}
+
+// SetDurable controls whether saves flush the new contents to stable storage
+// before replacing the file. It is off by default: the rename already keeps
+// the file consistent for other processes, and an fsync on every single-key
+// edit would dominate its latency. Callers that coalesce many edits into one
+// save can afford to turn it on.
+func (h *JSONHandler) SetDurable(durable bool) {
+	h.mutex.Lock()
+	defer h.mutex.Unlock()
+	h.durable = durable
+}
+
+// replaceFile atomically replaces the file with what write puts into a temp
+// file in the same directory (caller must hold lock)
+func (h *JSONHandler) replaceFile(write func(tempFile *os.File) error) error {
 	dir := filepath.Dir(h.filePath)
 	tempFile, err := os.CreateTemp(dir, "*.tmp")
 	if err != nil {
 		return fmt.Errorf("%w: Failed to create temp file: %v", ErrFileWriteError, err)
 	}
 	tempPath := tempFile.Name()
-	
+
 	defer func() {
 		tempFile.Close()
 		// Clean up temp file if it still exists
 		os.Remove(tempPath)
 	}()
 
-	// Encode JSON with indentation
-	encoder := json.NewEncoder(tempFile)
-	encoder.SetIndent("", getIndentString(indent))
-	encoder.SetEscapeHTML(false)
-	
-	if err := encoder.Encode(data); err != nil {
-		return fmt.Errorf("%w: Failed to encode JSON: %v", ErrFileWriteError, err)
+	if err := write(tempFile); err != nil {
+		return err
+	}
+
+	if h.durable {
+		if err := tempFile.Sync(); err != nil {
+			return fmt.Errorf("%w: Failed to sync temp file: %v", ErrFileWriteError, err)
+		}
 	}
 
 	if err := tempFile.Close(); err != nil {
@@ -112,13 +298,182 @@ func (h *JSONHandler) SaveJSON(data map[string]interface{}, indent int) error {
 		return fmt.Errorf("%w: Failed to rename temp file: %v", ErrFileWriteError, err)
 	}
 
-	// Update cache
+	// The rename is recorded in the directory, which needs its own sync to
+	// survive a power failure
+	if h.durable {
+		if err := syncDir(dir); err != nil {
+			return fmt.Errorf("%w: Failed to sync directory %s: %v", ErrFileWriteError, dir, err)
+		}
+	}
+
+	return nil
+}
+
+// syncDir flushes the directory entry changes in dir to stable storage.
+// Windows cannot sync directory handles and commits renames with the file
+// system metadata, so it is skipped there.
+func syncDir(dir string) error {
+	if runtime.GOOS == "windows" {
+		return nil
+	}
+
+	d, err := os.Open(dir)
+	if err != nil {
+		return err
+	}
+	defer d.Close()
+	return d.Sync()
+}
+
+// SpliceJSON replaces one value in a file of at least minSize bytes without
+// decoding the document. locate scans the file and returns the byte range of
+// the value; the unchanged prefix, the encoding of value and the unchanged
+// suffix are then copied from the same open file into a temp file that
+// atomically replaces it, so the edit costs one scan and one copy. The value is
+// indented to match the line it starts on, using the file's own indent unit.
+// It reports false without writing anything when the file is smaller than
+// minSize, locate finds nothing or fails, or the indentation cannot be
+// matched, for example in a file with mixed indentation; the caller then
+// loads and saves the whole document, which also reports any parse error.
+//
+// No decoded copy of the new contents exists, so the cached document is
+// dropped rather than patched, and the next read parses the bytes written.
+func (h *JSONHandler) SpliceJSON(minSize int64, value interface{}, locate func(r io.Reader) (offset, length int64, ok bool, err error)) (bool, error) {
+	h.mutex.Lock()
+	defer h.mutex.Unlock()
+
+	source, err := os.Open(h.filePath)
+	if err != nil {
+		return false, nil
+	}
+	defer source.Close()
+
+	fileInfo, err := source.Stat()
+	if err != nil || fileInfo.Size() < minSize {
+		return false, nil
+	}
+
+	offset, length, ok, err := locate(source)
+	if err != nil || !ok {
+		return false, nil
+	}
+
+	encoded, ok, err := encodeSpliceValue(source, offset, value)
+	if err != nil || !ok {
+		return false, err
+	}
+
+	// Unchanged prefix, new value, unchanged suffix
+	err = h.replaceFile(func(tempFile *os.File) error {
+		if _, err := source.Seek(0, io.SeekStart); err != nil {
+			return fmt.Errorf("%w: Failed to seek %s: %v", ErrFileReadError, h.filePath, err)
+		}
+		if _, err := io.CopyN(tempFile, source, offset); err != nil {
+			return fmt.Errorf("%w: Failed to copy file prefix: %v", ErrFileWriteError, err)
+		}
+		if _, err := tempFile.Write(encoded); err != nil {
+			return fmt.Errorf("%w: Failed to write temp file: %v", ErrFileWriteError, err)
+		}
+		if _, err := source.Seek(offset+length, io.SeekStart); err != nil {
+			return fmt.Errorf("%w: Failed to seek %s: %v", ErrFileReadError, h.filePath, err)
+		}
+		if _, err := io.Copy(tempFile, source); err != nil {
+			return fmt.Errorf("%w: Failed to copy file suffix: %v", ErrFileWriteError, err)
+		}
+		return nil
+	})
+	if err != nil {
+		return false, err
+	}
+
+	h.clearCacheLocked()
+	return true, nil
+}
+
+// spliceIndentWindow is how far back SpliceJSON looks for the start of the line
+const spliceIndentWindow = 4096
+
+// encodeSpliceValue encodes value for insertion at offset in file, indenting it
+// like the surrounding line or compactly when the file has no line breaks
+// there. It reports false when the file's indentation cannot be reproduced.
+func encodeSpliceValue(file *os.File, offset int64, value interface{}) ([]byte, bool, error) {
+	window := int64(spliceIndentWindow)
+	if offset < window {
+		window = offset
+	}
+	before := make([]byte, window)
+	if _, err := file.ReadAt(before, offset-window); err != nil {
+		return nil, false, fmt.Errorf("%w: Failed to read %s: %v", ErrFileReadError, file.Name(), err)
+	}
+
+	var buf bytes.Buffer
+	if newline := bytes.LastIndexByte(before, '\n'); newline >= 0 {
+		line := before[newline+1:]
+		prefix := line[:len(line)-len(bytes.TrimLeft(line, " \t"))]
+
+		unit, err := fileIndentUnit(file)
+		if err != nil {
+			return nil, false, err
+		}
+		if unit == nil || !isIndentedBy(prefix, unit) {
+			return nil, false, nil
+		}
+
+		if err := writeIndentedJSON(&buf, value, string(prefix), string(unit)); err != nil {
+			return nil, false, fmt.Errorf("%w: Failed to encode JSON: %v", ErrFileWriteError, err)
+		}
+		return buf.Bytes(), true, nil
+	}
+
+	encoder := json.NewEncoder(&buf)
+	encoder.SetEscapeHTML(false)
+	if err := encoder.Encode(value); err != nil {
+		return nil, false, fmt.Errorf("%w: Failed to encode JSON: %v", ErrFileWriteError, err)
+	}
+
+	return bytes.TrimSuffix(buf.Bytes(), []byte("\n")), true, nil
+}
+
+// fileIndentUnit returns the leading whitespace of the second line of file,
+// which holds the first member of the root object and so is indented by one
+// level. It returns nil if that line is not indented by a run of a single
+// whitespace character.
+func fileIndentUnit(file *os.File) ([]byte, error) {
+	head := make([]byte, spliceIndentWindow)
+	n, err := file.ReadAt(head, 0)
+	if err != nil && err != io.EOF {
+		return nil, fmt.Errorf("%w: Failed to read %s: %v", ErrFileReadError, file.Name(), err)
+	}
+	head = head[:n]
+
+	newline := bytes.IndexByte(head, '\n')
+	if newline < 0 {
+		return nil, nil
+	}
+	line := head[newline+1:]
+	unit := line[:len(line)-len(bytes.TrimLeft(line, " \t"))]
+	if len(unit) == 0 || len(bytes.Trim(unit, string(unit[:1]))) != 0 {
+		return nil, nil
+	}
+	return unit, nil
+}
+
+// isIndentedBy reports whether prefix is a whole number of repetitions of unit
+func isIndentedBy(prefix, unit []byte) bool {
+	return len(prefix)%len(unit) == 0 && len(bytes.Trim(prefix, string(unit[:1]))) == 0
+}
+
+// refreshCache records data as the current contents of the file just written.
+// The caller must hold the handler mutex.
+func (h *JSONHandler) refreshCache(data map[string]interface{}) {
 	h.cachedData = data
 	if fileInfo, err := os.Stat(h.filePath); err == nil {
 		h.fileMTime = fileInfo.ModTime()
+		h.fileSize = fileInfo.Size()
+		sharedParseCache.put(h.cacheKey, data, h.fileMTime, h.fileSize)
+	} else {
+		sharedParseCache.remove(h.cacheKey)
 	}
-
-	return nil
 }
 
 // ValidationResult represents the result of JSON validation
@@ -143,6 +498,47 @@ type PerformanceMetrics struct {
 	FileSize  int64   `json:"file_size"`
 }
 
+// LoadJSONForUpdate returns data the caller may modify freely. When the file
+// is already in the shared cache the cached document is copied, which is much
+// cheaper than parsing it again; the cached copy itself is never modified, so
+// concurrent readers keep seeing a consistent document until SaveJSON
+// publishes the new one.
+func (h *JSONHandler) LoadJSONForUpdate() (map[string]interface{}, error) {
+	h.mutex.Lock()
+	fileInfo, err := os.Stat(h.filePath)
+	if err == nil {
+		if cached, ok := sharedParseCache.get(h.cacheKey, fileInfo.ModTime(), fileInfo.Size()); ok {
+			h.mutex.Unlock()
+			return CopyValue(cached).(map[string]interface{}), nil
+		}
+	}
+	h.mutex.Unlock()
+
+	// Parse a private copy; stat errors are reported by LoadJSON
+	return h.LoadJSON(false)
+}
+
+// CopyValue deep-copies decoded JSON. Strings, numbers, booleans and nulls
+// are immutable and shared with the original.
+func CopyValue(value interface{}) interface{} {
+	switch v := value.(type) {
+	case map[string]interface{}:
+		copied := make(map[string]interface{}, len(v))
+		for key, item := range v {
+			copied[key] = CopyValue(item)
+		}
+		return copied
+	case []interface{}:
+		copied := make([]interface{}, len(v))
+		for i, item := range v {
+			copied[i] = CopyValue(item)
+		}
+		return copied
+	default:
+		return v
+	}
+}
+
 // ValidateJSONSyntax validates JSON file syntax without loading into memory completely
 func (h *JSONHandler) ValidateJSONSyntax() *ValidationResult {
 	result := &ValidationResult{
@@ -150,7 +546,7 @@ func (h *JSONHandler) ValidateJSONSyntax() *ValidationResult {
 	}
 
 	// Check if file exists
-	fileInfo, err := os.Stat(h.filePath)
+	file, err := os.Open(h.filePath)
 	if os.IsNotExist(err) {
 		result.Valid = false
 		result.ErrorType = "FILE_NOT_FOUND"
@@ -162,6 +558,22 @@ func (h *JSONHandler) ValidateJSONSyntax() *ValidationResult {
 		return result
 	}
 
+	var fileInfo os.FileInfo
+	if err == nil {
+		defer file.Close()
+		fileInfo, err = file.Stat()
+	}
+	if err != nil {
+		result.Valid = false
+		result.ErrorType = "FILE_READ_ERROR"
+		result.Error = &ValidationError{
+			Message: fmt.Sprintf("Failed to read file: %v", err),
+			Line:    0,
+			Column:  0,
+		}
+		return result
+	}
+
 	fileSize := fileInfo.Size()
 
 	if fileSize == 0 {
@@ -175,9 +587,12 @@ func (h *JSONHandler) ValidateJSONSyntax() *ValidationResult {
 		return result
 	}
 
-	// Read file content
+	// Always scan the bytes on disk: the parse cache is keyed by mtime and
+	// size, which an edit can leave unchanged
 	startTime := time.Now()
-	data, err := os.ReadFile(h.filePath)
+
+	// Read file content
+	data, err := readFileContents(file, fileSize)
 	if err != nil {
 		result.Valid = false
 		result.ErrorType = "FILE_READ_ERROR"
@@ -201,9 +616,10 @@ func (h *JSONHandler) ValidateJSONSyntax() *ValidationResult {
 		return result
 	}
 
-	// Try to parse JSON
-	var jsonData interface{}
-	if err := json.Unmarshal(data, &jsonData); err != nil {
+	// Validate with the scanner only; nothing is materialized for valid input
+	if !json.Valid(data) {
+		// Re-scan into a RawMessage to recover the positioned syntax error
+		err := json.Unmarshal(data, new(json.RawMessage))
 		result.Valid = false
 		result.ErrorType = "PARSE_ERROR"
 		
@@ -240,9 +656,16 @@ func (h *JSONHandler) ValidateJSONSyntax() *ValidationResult {
 func (h *JSONHandler) ClearCache() {
 	h.mutex.Lock()
 	defer h.mutex.Unlock()
-	
+
+	h.clearCacheLocked()
+}
+
+// clearCacheLocked is ClearCache for callers already holding the handler mutex
+func (h *JSONHandler) clearCacheLocked() {
 	h.cachedData = nil
 	h.fileMTime = time.Time{}
+	h.fileSize = 0
+	sharedParseCache.remove(h.cacheKey)
 }
 
 // FileInfo represents file information
@@ -277,26 +700,26 @@ func (h *JSONHandler) GetFileInfo() *FileInfo {
 
 // Helper function to get indent string
 func getIndentString(indent int) string {
-	result := ""
-	for i := 0; i < indent; i++ {
-		result += " "
+	if indent <= 0 {
+		return ""
 	}
-	return result
+	return strings.Repeat(" ", indent)
 }
 
 // Helper function to calculate line and column from byte offset
 func getLineColumn(data []byte, offset int64) (int, int) {
-	line := 1
-	col := 1
-	
-	for i := int64(0); i < offset && i < int64(len(data)); i++ {
-		if data[i] == '\n' {
-			line++
-			col = 1
-		} else {
-			col++
-		}
+	if offset < 0 {
+		offset = 0
+	}
+	if offset > int64(len(data)) {
+		offset = int64(len(data))
 	}
-	
+
+	// bytes.Count and LastIndexByte use the vectorized byte search, so
+	// locating an error deep in a large file doesn't walk it byte by byte
+	prefix := data[:offset]
+	line := 1 + bytes.Count(prefix, []byte{'\n'})
+	col := len(prefix) - (bytes.LastIndexByte(prefix, '\n') + 1) + 1
+
 	return line, col
 }
\ No newline at end of file
@@ -1,8 +1,14 @@
 package jsonhandler
 
 import (
+	"bytes"
 	"encoding/json"
+	"fmt"
+	"io"
 	"os"
+	"path/filepath"
+	"reflect"
+	"strings"
 	"testing"
 	"time"
 )
@@ -24,7 +30,6 @@ func TestLoadJSON(t *testing.T) {
 	}
 
 	tempFile := createTempJSONFile(t, testData)
-	defer os.Remove(tempFile)
 
 	handler := NewJSONHandler(tempFile)
 
@@ -65,35 +70,22 @@ func TestLoadJSONFileNotFound(t *testing.T) {
 
 func TestLoadJSONInvalidJSON(t *testing.T) {
 	// Create temp file with invalid JSON
-	tempFile, err := os.CreateTemp("", "invalid_*.json")
-	if err != nil {
+	tempFile := filepath.Join(t.TempDir(), "invalid.json")
+	if err := os.WriteFile(tempFile, []byte("{invalid json"), 0644); err != nil {
 		t.Fatal(err)
 	}
-	defer os.Remove(tempFile.Name())
 
-	_, err = tempFile.WriteString("{invalid json")
-	if err != nil {
-		t.Fatal(err)
-	}
-	tempFile.Close()
+	handler := NewJSONHandler(tempFile)
 
-	handler := NewJSONHandler(tempFile.Name())
-	
-	_, err = handler.LoadJSON(false)
+	_, err := handler.LoadJSON(false)
 	if err == nil {
 		t.Error("LoadJSON() should fail for invalid JSON")
 	}
 }
 
 func TestSaveJSON(t *testing.T) {
-	tempFile, err := os.CreateTemp("", "save_test_*.json")
-	if err != nil {
-		t.Fatal(err)
-	}
-	tempFile.Close()
-	defer os.Remove(tempFile.Name())
-
-	handler := NewJSONHandler(tempFile.Name())
+	tempFile := filepath.Join(t.TempDir(), "save_test.json")
+	handler := NewJSONHandler(tempFile)
 
 	testData := map[string]interface{}{
 		"key":    "value",
@@ -103,14 +95,14 @@ func TestSaveJSON(t *testing.T) {
 		},
 	}
 
-	err = handler.SaveJSON(testData, 2)
+	err := handler.SaveJSON(testData, 2)
 	if err != nil {
 		t.Errorf("SaveJSON() error = %v", err)
 		return
 	}
 
 	// Verify file was written correctly
-	data, err := os.ReadFile(tempFile.Name())
+	data, err := os.ReadFile(tempFile)
 	if err != nil {
 		t.Fatal(err)
 	}
@@ -129,6 +121,100 @@ func TestSaveJSON(t *testing.T) {
 	}
 }
 
+func TestSaveJSONDurable(t *testing.T) {
+	tempFile := createTempJSONFile(t, map[string]interface{}{"key": "value"})
+
+	handler := NewJSONHandler(tempFile)
+	handler.SetDurable(true)
+
+	if err := handler.SaveJSON(map[string]interface{}{"key": "durable"}, 2); err != nil {
+		t.Fatalf("SaveJSON() error = %v", err)
+	}
+
+	data, err := NewJSONHandler(tempFile).LoadJSON(false)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if data["key"] != "durable" {
+		t.Errorf("SaveJSON() saved key = %v, want durable", data["key"])
+	}
+}
+
+func TestSpliceJSONIndentation(t *testing.T) {
+	value := map[string]interface{}{"one": "1 item", "other": "{{count}} items"}
+
+	tests := []struct {
+		name        string
+		indent      string
+		wantSpliced bool
+	}{
+		{"four spaces", "    ", true},
+		{"tabs", "\t", true},
+		// Mixed indentation can't be reproduced, so the caller must save
+		{"mixed", " \t", false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			before := map[string]interface{}{
+				"section": map[string]interface{}{"item": "old", "other": "kept"},
+			}
+			content, err := json.MarshalIndent(before, "", tt.indent)
+			if err != nil {
+				t.Fatal(err)
+			}
+			tempFile := filepath.Join(t.TempDir(), "splice.json")
+			if err := os.WriteFile(tempFile, content, 0644); err != nil {
+				t.Fatal(err)
+			}
+
+			locate := func(r io.Reader) (int64, int64, bool, error) {
+				return int64(bytes.Index(content, []byte(`"old"`))), int64(len(`"old"`)), true, nil
+			}
+			spliced, err := NewJSONHandler(tempFile).SpliceJSON(0, value, locate)
+			if err != nil {
+				t.Fatalf("SpliceJSON() error = %v", err)
+			}
+			if spliced != tt.wantSpliced {
+				t.Fatalf("SpliceJSON() = %v, want %v", spliced, tt.wantSpliced)
+			}
+
+			want := content
+			if tt.wantSpliced {
+				after := map[string]interface{}{
+					"section": map[string]interface{}{"item": value, "other": "kept"},
+				}
+				if want, err = json.MarshalIndent(after, "", tt.indent); err != nil {
+					t.Fatal(err)
+				}
+			}
+			got, err := os.ReadFile(tempFile)
+			if err != nil {
+				t.Fatal(err)
+			}
+			if string(got) != string(want) {
+				t.Errorf("SpliceJSON() left\n%s\nwant\n%s", got, want)
+			}
+		})
+	}
+}
+
+func TestSpliceJSONSkipsSmallFiles(t *testing.T) {
+	tempFile := filepath.Join(t.TempDir(), "small.json")
+	if err := os.WriteFile(tempFile, []byte(`{"key": "value"}`), 0644); err != nil {
+		t.Fatal(err)
+	}
+
+	called := false
+	spliced, err := NewJSONHandler(tempFile).SpliceJSON(1<<20, "new", func(r io.Reader) (int64, int64, bool, error) {
+		called = true
+		return 8, 7, true, nil
+	})
+	if err != nil || spliced || called {
+		t.Errorf("SpliceJSON() = %v, %v (locate called: %v), want a small file left alone", spliced, err, called)
+	}
+}
+
 func TestValidateJSONSyntax(t *testing.T) {
 	tests := []struct {
 		name        string
@@ -147,6 +233,12 @@ func TestValidateJSONSyntax(t *testing.T) {
 			wantValid:   false,
 			wantErrType: "PARSE_ERROR",
 		},
+		{
+			name:        "trailing data after value",
+			content:     `{"key": "value"} extra`,
+			wantValid:   false,
+			wantErrType: "PARSE_ERROR",
+		},
 		{
 			name:        "empty file",
 			content:     "",
@@ -158,21 +250,12 @@ func TestValidateJSONSyntax(t *testing.T) {
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
 			// Create temp file with content
-			tempFile, err := os.CreateTemp("", "validate_*.json")
-			if err != nil {
+			tempFile := filepath.Join(t.TempDir(), "validate.json")
+			if err := os.WriteFile(tempFile, []byte(tt.content), 0644); err != nil {
 				t.Fatal(err)
 			}
-			defer os.Remove(tempFile.Name())
-
-			if tt.content != "" {
-				_, err = tempFile.WriteString(tt.content)
-				if err != nil {
-					t.Fatal(err)
-				}
-			}
-			tempFile.Close()
 
-			handler := NewJSONHandler(tempFile.Name())
+			handler := NewJSONHandler(tempFile)
 			result := handler.ValidateJSONSyntax()
 
 			if result.Valid != tt.wantValid {
@@ -183,8 +266,8 @@ func TestValidateJSONSyntax(t *testing.T) {
 				t.Errorf("ValidateJSONSyntax() ErrorType = %v, want %v", result.ErrorType, tt.wantErrType)
 			}
 
-			if result.File != tempFile.Name() {
-				t.Errorf("ValidateJSONSyntax() File = %v, want %v", result.File, tempFile.Name())
+			if result.File != tempFile {
+				t.Errorf("ValidateJSONSyntax() File = %v, want %v", result.File, tempFile)
 			}
 		})
 	}
@@ -202,13 +285,41 @@ func TestValidateJSONSyntaxFileNotFound(t *testing.T) {
 	}
 }
 
+func TestValidateJSONSyntaxIgnoresCache(t *testing.T) {
+	tempFile := filepath.Join(t.TempDir(), "validate.json")
+	if err := os.WriteFile(tempFile, []byte(`{"key": "value"}`), 0644); err != nil {
+		t.Fatal(err)
+	}
+	info, err := os.Stat(tempFile)
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	if _, err := NewJSONHandler(tempFile).LoadJSON(true); err != nil {
+		t.Fatalf("LoadJSON() error = %v", err)
+	}
+
+	// Corrupt the file without changing its size or modification time, so
+	// the cached parse still looks current
+	if err := os.WriteFile(tempFile, []byte(`{"key": "value"`+"\n"), 0644); err != nil {
+		t.Fatal(err)
+	}
+	if err := os.Chtimes(tempFile, info.ModTime(), info.ModTime()); err != nil {
+		t.Fatal(err)
+	}
+
+	result := NewJSONHandler(tempFile).ValidateJSONSyntax()
+	if result.Valid || result.ErrorType != "PARSE_ERROR" {
+		t.Errorf("ValidateJSONSyntax() = %v/%s for a corrupted file, want PARSE_ERROR", result.Valid, result.ErrorType)
+	}
+}
+
 func TestClearCache(t *testing.T) {
 	testData := map[string]interface{}{
 		"key": "value",
 	}
 
 	tempFile := createTempJSONFile(t, testData)
-	defer os.Remove(tempFile)
 
 	handler := NewJSONHandler(tempFile)
 
@@ -238,7 +349,6 @@ func TestGetFileInfo(t *testing.T) {
 	}
 
 	tempFile := createTempJSONFile(t, testData)
-	defer os.Remove(tempFile)
 
 	handler := NewJSONHandler(tempFile)
 
@@ -287,7 +397,6 @@ func TestCacheInvalidation(t *testing.T) {
 	}
 
 	tempFile := createTempJSONFile(t, testData)
-	defer os.Remove(tempFile)
 
 	handler := NewJSONHandler(tempFile)
 
@@ -323,23 +432,16 @@ func TestCacheInvalidation(t *testing.T) {
 
 // Helper function to create temporary JSON file
 func createTempJSONFile(t *testing.T, data map[string]interface{}) string {
-	tempFile, err := os.CreateTemp("", "test_*.json")
-	if err != nil {
-		t.Fatal(err)
-	}
-
 	jsonData, err := json.Marshal(data)
 	if err != nil {
 		t.Fatal(err)
 	}
 
-	_, err = tempFile.Write(jsonData)
-	if err != nil {
+	tempFile := filepath.Join(t.TempDir(), "test.json")
+	if err := os.WriteFile(tempFile, jsonData, 0644); err != nil {
 		t.Fatal(err)
 	}
-
-	tempFile.Close()
-	return tempFile.Name()
+	return tempFile
 }
 
 func TestGetLineColumn(t *testing.T) {
@@ -355,6 +457,7 @@ func TestGetLineColumn(t *testing.T) {
 		{2, 2, 1},   // After '\n', first space on line 2
 		{4, 2, 3},   // At '"key"' 
 		{21, 3, 2},  // Third line, second space
+		{100, 3, 10}, // Offset past the end clamps to end of data
 	}
 
 	for _, tt := range tests {
@@ -364,4 +467,244 @@ func TestGetLineColumn(t *testing.T) {
 				tt.offset, line, col, tt.wantLine, tt.wantCol)
 		}
 	}
-}
\ No newline at end of file
+}
+
+func TestSharedParseCache(t *testing.T) {
+	testData := map[string]interface{}{
+		"key": "value",
+	}
+
+	tempFile := createTempJSONFile(t, testData)
+
+	first, err := NewJSONHandler(tempFile).LoadJSON(true)
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	// A fresh handler for the same file should reuse the parsed data
+	second, err := NewJSONHandler(tempFile).LoadJSON(true)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if !sameMap(first, second) {
+		t.Error("LoadJSON() on a new handler should return the shared cached data")
+	}
+
+	// Loading without cache must not hand out the shared data
+	uncached, err := NewJSONHandler(tempFile).LoadJSON(false)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if sameMap(first, uncached) {
+		t.Error("LoadJSON(false) should parse the file instead of using the cache")
+	}
+
+	// Clearing the cache on any handler drops the shared entry
+	NewJSONHandler(tempFile).ClearCache()
+	third, err := NewJSONHandler(tempFile).LoadJSON(true)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if sameMap(first, third) {
+		t.Error("LoadJSON() should reparse after ClearCache()")
+	}
+}
+
+// sameMap reports whether a and b are the same map rather than equal copies
+func sameMap(a, b map[string]interface{}) bool {
+	return reflect.ValueOf(a).Pointer() == reflect.ValueOf(b).Pointer()
+}
+
+func TestParseCacheEviction(t *testing.T) {
+	cache := newParseCache(2)
+	modTime := time.Now()
+
+	cache.put("a", map[string]interface{}{"name": "a"}, modTime, 1)
+	cache.put("b", map[string]interface{}{"name": "b"}, modTime, 1)
+
+	// Touch "a" so "b" becomes the least recently used entry
+	if _, ok := cache.get("a", modTime, 1); !ok {
+		t.Fatal("get() should hit for a fresh entry")
+	}
+	cache.put("c", map[string]interface{}{"name": "c"}, modTime, 1)
+
+	if _, ok := cache.get("b", modTime, 1); ok {
+		t.Error("least recently used entry should be evicted")
+	}
+	if _, ok := cache.get("a", modTime, 1); !ok {
+		t.Error("recently used entry should be kept")
+	}
+	if _, ok := cache.get("c", modTime, 2); ok {
+		t.Error("get() should miss when the file size changed")
+	}
+}
+
+func TestParseCacheMarkStreamed(t *testing.T) {
+	cache := newParseCache(2)
+	modTime := time.Now()
+
+	if !cache.markStreamed("a", modTime, 1) {
+		t.Fatal("markStreamed() should allow streaming a new file version")
+	}
+	if _, ok := cache.get("a", modTime, 1); ok {
+		t.Error("get() should miss for a version that was only streamed")
+	}
+	if cache.markStreamed("a", modTime, 1) {
+		t.Error("markStreamed() should refuse streaming the same version twice")
+	}
+	if !cache.markStreamed("a", modTime, 2) {
+		t.Error("markStreamed() should allow streaming a changed file")
+	}
+
+	cache.put("b", map[string]interface{}{"name": "b"}, modTime, 1)
+	if cache.markStreamed("b", modTime, 1) {
+		t.Error("markStreamed() should refuse streaming a parsed version")
+	}
+}
+
+func TestPutEncodeBufferDropsLargeBuffers(t *testing.T) {
+	large := bytes.NewBuffer(make([]byte, 0, maxPooledBufferSize+1))
+	putEncodeBuffer(large)
+
+	for i := 0; i < 10; i++ {
+		if buf := encodeBufferPool.Get().(*bytes.Buffer); buf == large {
+			t.Fatal("Oversized buffer was returned to the pool")
+		}
+	}
+}
+
+func TestLoadAndValidateLargeFile(t *testing.T) {
+	// Build a document of a little over 1 MiB
+	testData := make(map[string]interface{})
+	for i := 0; len(testData)*64 <= 1<<20; i++ {
+		testData[fmt.Sprintf("key_%06d", i)] = strings.Repeat("x", 48)
+	}
+
+	tempFile := createTempJSONFile(t, testData)
+
+	handler := NewJSONHandler(tempFile)
+	result := handler.ValidateJSONSyntax()
+	if !result.Valid {
+		t.Fatalf("ValidateJSONSyntax() valid = false, error = %v", result.Error)
+	}
+
+	data, err := handler.LoadJSON(false)
+	if err != nil {
+		t.Fatalf("LoadJSON() error = %v", err)
+	}
+	if len(data) != len(testData) || data["key_000000"] != testData["key_000000"] {
+		t.Errorf("LoadJSON() returned %d keys, want %d", len(data), len(testData))
+	}
+
+	// Corrupt the tail of the file and check the error position is reported
+	content, err := os.ReadFile(tempFile)
+	if err != nil {
+		t.Fatal(err)
+	}
+	content = append(content[:len(content)-1], []byte("\n,")...)
+	if err := os.WriteFile(tempFile, content, 0644); err != nil {
+		t.Fatal(err)
+	}
+
+	result = handler.ValidateJSONSyntax()
+	if result.Valid {
+		t.Fatal("ValidateJSONSyntax() valid = true for corrupted file")
+	}
+	if result.Error == nil || result.Error.Line != 2 {
+		t.Errorf("ValidateJSONSyntax() error = %+v, want error on line 2", result.Error)
+	}
+}
+
+func TestReadFileContentsShrunkFile(t *testing.T) {
+	testData := make(map[string]interface{})
+	for i := 0; len(testData)*64 <= 1<<20; i++ {
+		testData[fmt.Sprintf("key_%06d", i)] = strings.Repeat("x", 48)
+	}
+	tempFile := createTempJSONFile(t, testData)
+
+	file, err := os.Open(tempFile)
+	if err != nil {
+		t.Fatal(err)
+	}
+	defer file.Close()
+	info, err := file.Stat()
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	// Another writer truncates the file between the stat and the read
+	if err := os.Truncate(tempFile, 8192); err != nil {
+		t.Fatal(err)
+	}
+
+	data, err := readFileContents(file, info.Size())
+	if err != nil {
+		t.Fatalf("readFileContents() error = %v", err)
+	}
+	if len(data) != 8192 {
+		t.Errorf("readFileContents() returned %d bytes, want 8192", len(data))
+	}
+	if json.Valid(data) {
+		t.Error("truncated contents should not be valid JSON")
+	}
+}
+
+func TestLoadJSONForUpdate(t *testing.T) {
+	testData := map[string]interface{}{
+		"nested": map[string]interface{}{"key": "value"},
+		"list":   []interface{}{"a", "b"},
+	}
+
+	tempFile := createTempJSONFile(t, testData)
+
+	cached, err := NewJSONHandler(tempFile).LoadJSON(true)
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	// The copy handed to writers must not share any containers with the cache
+	data, err := NewJSONHandler(tempFile).LoadJSONForUpdate()
+	if err != nil {
+		t.Fatal(err)
+	}
+	data["nested"].(map[string]interface{})["key"] = "changed"
+	data["list"].([]interface{})[0] = "changed"
+
+	if cached["nested"].(map[string]interface{})["key"] != "value" {
+		t.Error("LoadJSONForUpdate() returned a map shared with the cache")
+	}
+	if cached["list"].([]interface{})[0] != "a" {
+		t.Error("LoadJSONForUpdate() returned a slice shared with the cache")
+	}
+
+	// Without a cached entry the file is parsed
+	NewJSONHandler(tempFile).ClearCache()
+	data, err = NewJSONHandler(tempFile).LoadJSONForUpdate()
+	if err != nil {
+		t.Fatal(err)
+	}
+	if data["nested"].(map[string]interface{})["key"] != "value" {
+		t.Errorf("LoadJSONForUpdate() = %v, want data from file", data)
+	}
+
+	if _, err := NewJSONHandler("nonexistent.json").LoadJSONForUpdate(); err == nil {
+		t.Error("LoadJSONForUpdate() expected error for missing file")
+	}
+}
+
+func TestResolveCacheKey(t *testing.T) {
+	absPath, err := filepath.Abs("test.json")
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	if got := resolveCacheKey("test.json"); got != absPath {
+		t.Errorf("resolveCacheKey() = %s, want %s", got, absPath)
+	}
+	if got := resolveCacheKey("./test.json"); got != absPath {
+		t.Errorf("resolveCacheKey() = %s, want %s", got, absPath)
+	}
+	if NewJSONHandler("test.json").cacheKey != NewJSONHandler("./test.json").cacheKey {
+		t.Error("Handlers for the same file should share a cache key")
+	}
+}
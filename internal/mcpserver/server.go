@@ -1,15 +1,62 @@
 package mcpserver
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
+	"strings"
+	"sync"
 
 	"github.com/mark3labs/mcp-go/mcp"
 	"github.com/mark3labs/mcp-go/server"
 	"jsonmcptool/internal/operations"
 )
 
+// resultBufferPool reuses buffers for serializing tool results
+var resultBufferPool = sync.Pool{
+	New: func() interface{} {
+		return new(bytes.Buffer)
+	},
+}
+
+// maxPooledResultSize caps the buffers kept in resultBufferPool, so removing
+// one huge subtree doesn't pin a buffer of that size for the process lifetime
+const maxPooledResultSize = 1 << 20
+
+// marshalResult serializes a tool result as indented JSON text. HTML
+// characters are left unescaped: translation strings routinely contain markup,
+// and escaping it both bloats the output and makes it harder to read.
+func marshalResult(value interface{}) (string, error) {
+	buf := resultBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	defer func() {
+		if buf.Cap() <= maxPooledResultSize {
+			resultBufferPool.Put(buf)
+		}
+	}()
+
+	encoder := json.NewEncoder(buf)
+	encoder.SetIndent("", "  ")
+	encoder.SetEscapeHTML(false)
+	if err := encoder.Encode(value); err != nil {
+		return "", err
+	}
+
+	return strings.TrimSuffix(buf.String(), "\n"), nil
+}
+
+// Status markers that prefix tool responses
+const (
+	statusOK    = "✅ "
+	statusError = "❌ "
+)
+
+// errorResult reports a failed operation to the client
+func errorResult(err error) *mcp.CallToolResult {
+	return mcp.NewToolResultError(statusError + "Error: " + err.Error())
+}
+
 // NewJSONMcpServer creates a new MCP server for JSON operations
 func NewJSONMcpServer() *server.MCPServer {
 	s := server.NewMCPServer(
@@ -26,6 +73,7 @@ func NewJSONMcpServer() *server.MCPServer {
 	addListKeysTool(s)
 	addKeyExistsTool(s)
 	addValidateJSONTool(s)
+	addBatchTool(s)
 
 	return s
 }
@@ -57,15 +105,15 @@ func addGetKeyTool(s *server.MCPServer) {
 
 		result, err := operations.GetKey(filePath, keyPath)
 		if err != nil {
-			return mcp.NewToolResultError(fmt.Sprintf("❌ Error: %s", err.Error())), nil
+			return errorResult(err), nil
 		}
 
-		jsonResult, err := json.MarshalIndent(result, "", "  ")
+		jsonResult, err := marshalResult(result)
 		if err != nil {
-			return mcp.NewToolResultError(fmt.Sprintf("❌ Error serializing result: %v", err)), nil
+			return mcp.NewToolResultError(statusError + "Error serializing result: " + err.Error()), nil
 		}
 
-		return mcp.NewToolResultText(string(jsonResult)), nil
+		return mcp.NewToolResultText(jsonResult), nil
 	})
 }
 
@@ -105,10 +153,10 @@ func addAddKeyTool(s *server.MCPServer) {
 
 		err := operations.AddKey(filePath, keyPath, value)
 		if err != nil {
-			return mcp.NewToolResultError(fmt.Sprintf("❌ Error: %s", err.Error())), nil
+			return errorResult(err), nil
 		}
 
-		return mcp.NewToolResultText(fmt.Sprintf("✅ Added key '%s' to %s", keyPath, filePath)), nil
+		return mcp.NewToolResultText(statusOK + "Added key '" + keyPath + "' to " + filePath), nil
 	})
 }
 
@@ -148,10 +196,10 @@ func addUpdateKeyTool(s *server.MCPServer) {
 
 		err := operations.UpdateKey(filePath, keyPath, value)
 		if err != nil {
-			return mcp.NewToolResultError(fmt.Sprintf("❌ Error: %s", err.Error())), nil
+			return errorResult(err), nil
 		}
 
-		return mcp.NewToolResultText(fmt.Sprintf("✅ Updated key '%s' in %s", keyPath, filePath)), nil
+		return mcp.NewToolResultText(statusOK + "Updated key '" + keyPath + "' in " + filePath), nil
 	})
 }
 
@@ -191,10 +239,10 @@ func addRenameKeyTool(s *server.MCPServer) {
 
 		err := operations.RenameKey(filePath, oldPath, newPath)
 		if err != nil {
-			return mcp.NewToolResultError(fmt.Sprintf("❌ Error: %s", err.Error())), nil
+			return errorResult(err), nil
 		}
 
-		return mcp.NewToolResultText(fmt.Sprintf("✅ Renamed '%s' → '%s' in %s", oldPath, newPath, filePath)), nil
+		return mcp.NewToolResultText(statusOK + "Renamed '" + oldPath + "' → '" + newPath + "' in " + filePath), nil
 	})
 }
 
@@ -225,15 +273,15 @@ func addRemoveKeyTool(s *server.MCPServer) {
 
 		removedValue, err := operations.RemoveKey(filePath, keyPath)
 		if err != nil {
-			return mcp.NewToolResultError(fmt.Sprintf("❌ Error: %s", err.Error())), nil
+			return errorResult(err), nil
 		}
 
-		jsonValue, err := json.MarshalIndent(removedValue, "", "  ")
+		jsonValue, err := marshalResult(removedValue)
 		if err != nil {
-			return mcp.NewToolResultError(fmt.Sprintf("❌ Error serializing removed value: %v", err)), nil
+			return mcp.NewToolResultError(statusError + "Error serializing removed value: " + err.Error()), nil
 		}
 
-		return mcp.NewToolResultText(fmt.Sprintf("✅ Removed key '%s' from %s\nRemoved value: %s", keyPath, filePath, string(jsonValue))), nil
+		return mcp.NewToolResultText(statusOK + "Removed key '" + keyPath + "' from " + filePath + "\nRemoved value: " + jsonValue), nil
 	})
 }
 
@@ -264,7 +312,7 @@ func addListKeysTool(s *server.MCPServer) {
 
 		keys, err := operations.ListKeys(filePath, keyPath)
 		if err != nil {
-			return mcp.NewToolResultError(fmt.Sprintf("❌ Error: %s", err.Error())), nil
+			return errorResult(err), nil
 		}
 
 		pathDesc := "at root level"
@@ -272,15 +320,32 @@ func addListKeysTool(s *server.MCPServer) {
 			pathDesc = fmt.Sprintf("at '%s'", *keyPath)
 		}
 
-		result := fmt.Sprintf("Keys %s in %s:\n", pathDesc, filePath)
-		for _, key := range keys {
-			result += fmt.Sprintf("• %s\n", key)
-		}
-
-		return mcp.NewToolResultText(result), nil
+		header := fmt.Sprintf("Keys %s in %s:\n", pathDesc, filePath)
+		return mcp.NewToolResultText(formatKeyList(header, keys)), nil
 	})
 }
 
+// formatKeyList renders keys as a bulleted list below header. The output is
+// sized up front so large key sets are built in a single allocation.
+func formatKeyList(header string, keys []string) string {
+	const bullet = "• "
+
+	size := len(header)
+	for _, key := range keys {
+		size += len(bullet) + len(key) + 1
+	}
+
+	var builder strings.Builder
+	builder.Grow(size)
+	builder.WriteString(header)
+	for _, key := range keys {
+		builder.WriteString(bullet)
+		builder.WriteString(key)
+		builder.WriteByte('\n')
+	}
+	return builder.String()
+}
+
 // addKeyExistsTool adds the key_exists tool
 func addKeyExistsTool(s *server.MCPServer) {
 	existsTool := mcp.NewTool("key_exists",
@@ -308,15 +373,15 @@ func addKeyExistsTool(s *server.MCPServer) {
 
 		exists, err := operations.KeyExists(filePath, keyPath)
 		if err != nil {
-			return mcp.NewToolResultError(fmt.Sprintf("❌ Error: %s", err.Error())), nil
+			return errorResult(err), nil
 		}
 
-		status := "❌ does not exist"
+		status := statusError + "does not exist"
 		if exists {
-			status = "✅ exists"
+			status = statusOK + "exists"
 		}
 
-		return mcp.NewToolResultText(fmt.Sprintf("Key '%s' %s in %s", keyPath, status, filePath)), nil
+		return mcp.NewToolResultText("Key '" + keyPath + "' " + status + " in " + filePath), nil
 	})
 }
 
@@ -338,7 +403,7 @@ func addValidateJSONTool(s *server.MCPServer) {
 
 		result, err := operations.ValidateJSON(filePath)
 		if err != nil {
-			return mcp.NewToolResultError(fmt.Sprintf("❌ Error: %s", err.Error())), nil
+			return errorResult(err), nil
 		}
 
 		if result.Valid {
@@ -346,7 +411,7 @@ func addValidateJSONTool(s *server.MCPServer) {
 			if result.Performance != nil {
 				perf = fmt.Sprintf("\nFile size: %d bytes\nParse time: %.3fs", result.Performance.FileSize, result.Performance.ParseTime)
 			}
-			return mcp.NewToolResultText(fmt.Sprintf("✅ %s is valid JSON%s", filePath, perf)), nil
+			return mcp.NewToolResultText(statusOK + filePath + " is valid JSON" + perf), nil
 		} else {
 			errorMsg := "Unknown error"
 			line := 0
@@ -354,7 +419,62 @@ func addValidateJSONTool(s *server.MCPServer) {
 				errorMsg = result.Error.Message
 				line = result.Error.Line
 			}
-			return mcp.NewToolResultText(fmt.Sprintf("❌ %s contains invalid JSON\nError: %s\nLine: %d", filePath, errorMsg, line)), nil
+			return mcp.NewToolResultText(fmt.Sprintf(statusError+"%s contains invalid JSON\nError: %s\nLine: %d", filePath, errorMsg, line)), nil
 		}
 	})
-}
\ No newline at end of file
+}
+
+// addBatchTool adds the batch tool
+func addBatchTool(s *server.MCPServer) {
+	batchTool := mcp.NewTool("batch",
+		mcp.WithDescription("Apply several tool calls to one JSON file, loading and saving it only once"),
+		mcp.WithString("file_path",
+			mcp.Required(),
+			mcp.Description("Path to the JSON file"),
+		),
+		mcp.WithArray("calls",
+			mcp.Required(),
+			mcp.Description("Calls to apply in order, each an object with 'tool' (get_key, add_key, update_key, rename_key, remove_key, list_keys or key_exists) and that tool's arguments: key_path, value, old_path, new_path"),
+			mcp.Items(map[string]interface{}{"type": "object"}),
+		),
+		mcp.WithBoolean("atomic",
+			mcp.Description("Abort on the first failing call and save nothing (default false: each call succeeds or fails on its own)"),
+		),
+	)
+
+	s.AddTool(batchTool, func(ctx context.Context, request mcp.CallToolRequest) (*mcp.CallToolResult, error) {
+		filePath := mcp.ParseString(request, "file_path", "")
+		if filePath == "" {
+			return mcp.NewToolResultError("Missing file_path"), nil
+		}
+
+		rawCalls := mcp.ParseArgument(request, "calls", nil)
+		if rawCalls == nil {
+			return mcp.NewToolResultError("Missing calls"), nil
+		}
+
+		// Round-trip through JSON to decode the generic arguments into typed calls
+		var calls []operations.BatchCall
+		encoded, err := json.Marshal(rawCalls)
+		if err == nil {
+			err = json.Unmarshal(encoded, &calls)
+		}
+		if err != nil {
+			return mcp.NewToolResultError(statusError + "Error: Invalid calls: " + err.Error()), nil
+		}
+
+		atomic := mcp.ParseBoolean(request, "atomic", false)
+
+		results, err := operations.ApplyBatch(filePath, calls, atomic)
+		if err != nil {
+			return errorResult(err), nil
+		}
+
+		jsonResult, err := marshalResult(results)
+		if err != nil {
+			return mcp.NewToolResultError(statusError + "Error serializing result: " + err.Error()), nil
+		}
+
+		return mcp.NewToolResultText(jsonResult), nil
+	})
+}
@@ -0,0 +1,119 @@
+package operations
+
+import (
+	"fmt"
+
+	"jsonmcptool/internal/jsonhandler"
+	"jsonmcptool/internal/pathresolver"
+)
+
+// BatchCall is a single tool call applied as part of a batch
+type BatchCall struct {
+	Tool    string      `json:"tool"`
+	KeyPath string      `json:"key_path,omitempty"`
+	OldPath string      `json:"old_path,omitempty"`
+	NewPath string      `json:"new_path,omitempty"`
+	Value   interface{} `json:"value,omitempty"`
+}
+
+// BatchResult is the outcome of one call in a batch
+type BatchResult struct {
+	Tool    string      `json:"tool"`
+	Success bool        `json:"success"`
+	Result  interface{} `json:"result"`
+	Error   string      `json:"error,omitempty"`
+}
+
+// ApplyBatch runs several tool calls against one file, loading it once and
+// saving it once after all calls ran. By default each call succeeds or fails
+// on its own and the file is written if at least one mutating call succeeded.
+// With atomic set, the first failing call aborts the batch and nothing is
+// saved.
+func ApplyBatch(filePath string, calls []BatchCall, atomic bool) ([]BatchResult, error) {
+	handler := jsonhandler.NewJSONHandler(filePath)
+	// One save stands in for a save per call, so it can afford an fsync
+	handler.SetDurable(true)
+	unlock := handler.LockUpdates()
+	defer unlock()
+
+	data, err := handler.LoadJSONForUpdate()
+	if err != nil {
+		return nil, err
+	}
+
+	results := make([]BatchResult, 0, len(calls))
+	modified := false
+
+	for i, call := range calls {
+		var result interface{}
+		mutated := false
+
+		apply, ok := batchHandlers[call.Tool]
+		if ok {
+			result, mutated, err = apply(data, filePath, call)
+		} else {
+			err = fmt.Errorf("%w: Tool '%s' cannot be used in a batch", ErrUnknownTool, call.Tool)
+		}
+
+		if err != nil {
+			results = append(results, BatchResult{Tool: call.Tool, Error: err.Error()})
+			if atomic {
+				// data is a private copy, so dropping it discards the earlier calls
+				return results, fmt.Errorf("%w: Call %d (%s) failed, no changes were saved: %v", ErrBatchError, i+1, call.Tool, err)
+			}
+			continue
+		}
+
+		modified = modified || mutated
+		results = append(results, BatchResult{Tool: call.Tool, Success: true, Result: result})
+	}
+
+	if modified {
+		if err := handler.SaveJSON(data, 2); err != nil {
+			return nil, fmt.Errorf("%w: Failed to save file: %v", ErrBatchError, err)
+		}
+	}
+
+	return results, nil
+}
+
+// batchHandler applies one call against already loaded data and reports
+// whether it modified the data
+type batchHandler func(data map[string]interface{}, filePath string, call BatchCall) (interface{}, bool, error)
+
+// batchHandlers maps each tool usable in a batch to its in-memory implementation
+var batchHandlers = map[string]batchHandler{
+	"get_key": func(data map[string]interface{}, filePath string, call BatchCall) (interface{}, bool, error) {
+		value, err := getKeyFromData(data, filePath, call.KeyPath)
+		// Results are serialized after the whole batch ran, so take a copy
+		// before later calls change the subtree
+		return jsonhandler.CopyValue(value), false, err
+	},
+	"add_key": func(data map[string]interface{}, filePath string, call BatchCall) (interface{}, bool, error) {
+		return nil, true, addKeyToData(data, filePath, call.KeyPath, call.Value)
+	},
+	"update_key": func(data map[string]interface{}, filePath string, call BatchCall) (interface{}, bool, error) {
+		return nil, true, updateKeyInData(data, filePath, call.KeyPath, call.Value)
+	},
+	"rename_key": func(data map[string]interface{}, filePath string, call BatchCall) (interface{}, bool, error) {
+		if err := validateRenamePaths(call.OldPath, call.NewPath); err != nil {
+			return nil, false, err
+		}
+		return nil, true, renameKeyInData(data, filePath, call.OldPath, call.NewPath)
+	},
+	"remove_key": func(data map[string]interface{}, filePath string, call BatchCall) (interface{}, bool, error) {
+		value, err := removeKeyFromData(data, filePath, call.KeyPath)
+		return value, true, err
+	},
+	"list_keys": func(data map[string]interface{}, filePath string, call BatchCall) (interface{}, bool, error) {
+		var keyPath *string
+		if call.KeyPath != "" {
+			keyPath = &call.KeyPath
+		}
+		keys, err := listKeysInData(data, filePath, keyPath)
+		return keys, false, err
+	},
+	"key_exists": func(data map[string]interface{}, filePath string, call BatchCall) (interface{}, bool, error) {
+		return pathresolver.KeyExists(data, call.KeyPath), false, nil
+	},
+}
@@ -0,0 +1,129 @@
+package operations
+
+import (
+	"errors"
+	"testing"
+)
+
+func TestApplyBatch(t *testing.T) {
+	t.Parallel()
+
+	tempFile := createTempJSONFile(t, sampleI18nData)
+
+	calls := []BatchCall{
+		{Tool: "add_key", KeyPath: "alerts.info", Value: "For your information"},
+		{Tool: "update_key", KeyPath: "dashboard.title", Value: "Overview"},
+		{Tool: "rename_key", OldPath: "navigation.about", NewPath: "navigation.aboutUs"},
+		{Tool: "remove_key", KeyPath: "alerts.warning"},
+		{Tool: "add_key", KeyPath: "dashboard.title", Value: "Duplicate"},
+		{Tool: "get_key", KeyPath: "alerts.info"},
+		{Tool: "key_exists", KeyPath: "alerts.warning"},
+		{Tool: "list_keys", KeyPath: "navigation"},
+		{Tool: "validate_json"},
+	}
+
+	results, err := ApplyBatch(tempFile, calls, false)
+	if err != nil {
+		t.Fatalf("ApplyBatch() error = %v", err)
+	}
+	if len(results) != len(calls) {
+		t.Fatalf("ApplyBatch() returned %d results, want %d", len(results), len(calls))
+	}
+
+	wantSuccess := []bool{true, true, true, true, false, true, true, true, false}
+	for i, result := range results {
+		if result.Success != wantSuccess[i] {
+			t.Errorf("result %d (%s) success = %v, want %v (error: %s)", i, result.Tool, result.Success, wantSuccess[i], result.Error)
+		}
+	}
+
+	if results[3].Result != "Please check your input" {
+		t.Errorf("remove_key result = %v, want removed value", results[3].Result)
+	}
+	if results[5].Result != "For your information" {
+		t.Errorf("get_key result = %v, want value added earlier in the batch", results[5].Result)
+	}
+	if results[6].Result != false {
+		t.Errorf("key_exists result = %v, want false after removal", results[6].Result)
+	}
+	if !sliceContainsSameElements(results[7].Result.([]string), []string{"home", "aboutUs", "contact"}) {
+		t.Errorf("list_keys result = %v, want renamed key", results[7].Result)
+	}
+
+	// All successful mutations were saved
+	value, err := GetKey(tempFile, "dashboard.title")
+	if err != nil || value != "Overview" {
+		t.Errorf("GetKey() after batch = %v, %v, want Overview", value, err)
+	}
+	exists, _ := KeyExists(tempFile, "navigation.aboutUs")
+	if !exists {
+		t.Error("renamed key should exist after batch")
+	}
+}
+
+func TestApplyBatchGetKeySnapshot(t *testing.T) {
+	t.Parallel()
+
+	tempFile := createTempJSONFile(t, sampleI18nData)
+
+	calls := []BatchCall{
+		{Tool: "get_key", KeyPath: "navigation"},
+		{Tool: "remove_key", KeyPath: "navigation.home"},
+		{Tool: "update_key", KeyPath: "navigation.about", Value: "About us"},
+	}
+
+	results, err := ApplyBatch(tempFile, calls, false)
+	if err != nil {
+		t.Fatalf("ApplyBatch() error = %v", err)
+	}
+
+	// get_key reports the subtree as it was read, not as later calls left it
+	if !deepEqual(results[0].Result, sampleI18nData["navigation"]) {
+		t.Errorf("get_key result = %v, want %v", results[0].Result, sampleI18nData["navigation"])
+	}
+}
+
+func TestApplyBatchFileNotFound(t *testing.T) {
+	t.Parallel()
+
+	_, err := ApplyBatch("nonexistent.json", []BatchCall{{Tool: "get_key", KeyPath: "any.key"}}, false)
+	if err == nil {
+		t.Error("ApplyBatch() should fail for nonexistent file")
+	}
+}
+
+func TestApplyBatchAtomic(t *testing.T) {
+	t.Parallel()
+
+	tempFile := createTempJSONFile(t, sampleI18nData)
+
+	// A failing call discards every change made earlier in the batch
+	calls := []BatchCall{
+		{Tool: "update_key", KeyPath: "dashboard.title", Value: "Overview"},
+		{Tool: "add_key", KeyPath: "dashboard.title", Value: "Duplicate"},
+		{Tool: "remove_key", KeyPath: "alerts.warning"},
+	}
+
+	results, err := ApplyBatch(tempFile, calls, true)
+	if !errors.Is(err, ErrBatchError) {
+		t.Fatalf("ApplyBatch() error = %v, want %v", err, ErrBatchError)
+	}
+	if len(results) != 2 || !results[0].Success || results[1].Success {
+		t.Errorf("ApplyBatch() results = %+v, want the calls up to the failure", results)
+	}
+
+	value, err := GetKey(tempFile, "dashboard.title")
+	if err != nil || value != "Dashboard" {
+		t.Errorf("GetKey() after failed batch = %v, %v, want unchanged value", value, err)
+	}
+
+	// Without failures an atomic batch saves everything
+	calls = calls[:1]
+	if _, err := ApplyBatch(tempFile, calls, true); err != nil {
+		t.Fatalf("ApplyBatch() error = %v", err)
+	}
+	value, err = GetKey(tempFile, "dashboard.title")
+	if err != nil || value != "Overview" {
+		t.Errorf("GetKey() after batch = %v, %v, want Overview", value, err)
+	}
+}
@@ -1,9 +1,11 @@
 package operations
 
 import (
+	"encoding/json"
 	"errors"
 	"fmt"
-	"time"
+	"io"
+	"strings"
 
 	"jsonmcptool/internal/jsonhandler"
 	"jsonmcptool/internal/pathresolver"
@@ -20,16 +22,44 @@ var (
 	ErrRemoveKeyError = errors.New("REMOVE_KEY_ERROR")
 	ErrRenameKeyError = errors.New("RENAME_KEY_ERROR")
 	ErrSameKey       = errors.New("SAME_KEY")
+	ErrUnknownTool   = errors.New("UNKNOWN_TOOL")
+	ErrBatchError    = errors.New("BATCH_ERROR")
 )
 
+// streamingLookupThreshold is the file size above which uncached reads scan
+// the file for the requested key instead of decoding the whole document
+const streamingLookupThreshold = 1 << 20
+
 // GetKey retrieves value by dot-notation key path
 func GetKey(filePath, keyPath string) (interface{}, error) {
 	handler := jsonhandler.NewJSONHandler(filePath)
+
+	// Large uncached files: decode only the requested value on the first read;
+	// a repeat read parses the whole file so later reads hit the cache
+	var raw json.RawMessage
+	found := false
+	_, err := handler.StreamUncached(streamingLookupThreshold, func(r io.Reader) error {
+		var streamErr error
+		raw, found, streamErr = pathresolver.StreamToKey(r, keyPath)
+		return streamErr
+	})
+	if err == nil && found {
+		var value interface{}
+		if err := json.Unmarshal(raw, &value); err == nil {
+			return value, nil
+		}
+	}
+
 	data, err := handler.LoadJSON(true)
 	if err != nil {
 		return nil, err
 	}
 
+	return getKeyFromData(data, filePath, keyPath)
+}
+
+// getKeyFromData retrieves a value from already loaded data
+func getKeyFromData(data map[string]interface{}, filePath, keyPath string) (interface{}, error) {
 	value, err := pathresolver.NavigateToKey(data, keyPath)
 	if err != nil {
 		if errors.Is(err, pathresolver.ErrKeyNotFound) {
@@ -47,70 +77,124 @@ func GetKey(filePath, keyPath string) (interface{}, error) {
 // AddKey adds new key-value pair
 func AddKey(filePath, keyPath string, value interface{}) error {
 	handler := jsonhandler.NewJSONHandler(filePath)
-	data, err := handler.LoadJSON(true)
+	unlock := handler.LockUpdates()
+	defer unlock()
+
+	data, err := handler.LoadJSONForUpdate()
 	if err != nil {
 		return err
 	}
 
-	// Check if key already exists
-	if pathresolver.KeyExists(data, keyPath) {
-		return fmt.Errorf("%w: Key '%s' already exists in %s", ErrKeyExists, keyPath, filePath)
+	if err := addKeyToData(data, filePath, keyPath, value); err != nil {
+		return err
+	}
+
+	// Save the updated data
+	if err := handler.SaveJSON(data, 2); err != nil {
+		return fmt.Errorf("%w: Failed to save file: %v", ErrAddKeyError, err)
 	}
 
-	// Create the nested path and set the value
-	err = pathresolver.SetValueAtPath(data, keyPath, value, true)
+	return nil
+}
+
+// addKeyToData adds a new key to already loaded data
+func addKeyToData(data map[string]interface{}, filePath, keyPath string, value interface{}) error {
+	// Check the key is absent and set the value in one walk
+	err := pathresolver.AddValueAtPath(data, keyPath, value)
 	if err != nil {
+		if errors.Is(err, pathresolver.ErrKeyExists) {
+			return fmt.Errorf("%w: Key '%s' already exists in %s", ErrKeyExists, keyPath, filePath)
+		}
 		if errors.Is(err, pathresolver.ErrPathConflict) {
 			return fmt.Errorf("PATH_CONFLICT: %v", err)
 		}
 		return fmt.Errorf("%w: Failed to add key '%s': %v", ErrAddKeyError, keyPath, err)
 	}
 
-	// Save the updated data
-	if err := handler.SaveJSON(data, 2); err != nil {
-		return fmt.Errorf("%w: Failed to save file: %v", ErrAddKeyError, err)
-	}
-
 	return nil
 }
 
 // UpdateKey updates existing key with new value
 func UpdateKey(filePath, keyPath string, value interface{}) error {
 	handler := jsonhandler.NewJSONHandler(filePath)
-	data, err := handler.LoadJSON(true)
+	unlock := handler.LockUpdates()
+	defer unlock()
+
+	// Large files: find the value with one scan and rewrite only its bytes,
+	// without decoding the document
+	spliced, err := handler.SpliceJSON(streamingLookupThreshold, value, func(r io.Reader) (int64, int64, bool, error) {
+		return pathresolver.LocateValue(r, keyPath)
+	})
+	if err != nil {
+		return fmt.Errorf("%w: Failed to save file: %v", ErrUpdateKeyError, err)
+	}
+	if spliced {
+		return nil
+	}
+
+	data, err := handler.LoadJSONForUpdate()
 	if err != nil {
 		return err
 	}
 
+	if err := updateKeyInData(data, filePath, keyPath, value); err != nil {
+		return err
+	}
+
+	// Save the updated data
+	if err := handler.SaveJSON(data, 2); err != nil {
+		return fmt.Errorf("%w: Failed to save file: %v", ErrUpdateKeyError, err)
+	}
+
+	return nil
+}
+
+// updateKeyInData replaces the value of an existing key in already loaded data
+func updateKeyInData(data map[string]interface{}, filePath, keyPath string, value interface{}) error {
 	// Validate path first
 	if err := pathresolver.ValidatePath(keyPath); err != nil {
 		return fmt.Errorf("%w: %v", ErrInvalidPath, err)
 	}
 
-	// Check if key exists
-	if !pathresolver.KeyExists(data, keyPath) {
+	// Find the key and update it in place with a single walk
+	parent, key, found := pathresolver.LocateKey(data, keyPath)
+	if !found {
 		return fmt.Errorf("%w: Key '%s' not found in %s", ErrKeyNotFound, keyPath, filePath)
 	}
 
-	// Update the value
-	err = pathresolver.SetValueAtPath(data, keyPath, value, false)
+	parent[key] = value
+	return nil
+}
+
+// RenameKey renames existing key (move value from old path to new path)
+func RenameKey(filePath, oldPath, newPath string) error {
+	if err := validateRenamePaths(oldPath, newPath); err != nil {
+		return err
+	}
+
+	handler := jsonhandler.NewJSONHandler(filePath)
+	unlock := handler.LockUpdates()
+	defer unlock()
+
+	data, err := handler.LoadJSONForUpdate()
 	if err != nil {
-		if errors.Is(err, pathresolver.ErrKeyNotFound) {
-			return fmt.Errorf("%w: Key '%s' not found in %s", ErrKeyNotFound, keyPath, filePath)
-		}
-		return fmt.Errorf("%w: Failed to update key '%s': %v", ErrUpdateKeyError, keyPath, err)
+		return err
+	}
+
+	if err := renameKeyInData(data, filePath, oldPath, newPath); err != nil {
+		return err
 	}
 
 	// Save the updated data
 	if err := handler.SaveJSON(data, 2); err != nil {
-		return fmt.Errorf("%w: Failed to save file: %v", ErrUpdateKeyError, err)
+		return fmt.Errorf("%w: Failed to save file: %v", ErrRenameKeyError, err)
 	}
 
 	return nil
 }
 
-// RenameKey renames existing key (move value from old path to new path)
-func RenameKey(filePath, oldPath, newPath string) error {
+// validateRenamePaths checks rename arguments before any data is loaded
+func validateRenamePaths(oldPath, newPath string) error {
 	if oldPath == newPath {
 		return fmt.Errorf("%w: Old and new key paths cannot be the same", ErrSameKey)
 	}
@@ -123,77 +207,96 @@ func RenameKey(filePath, oldPath, newPath string) error {
 		return fmt.Errorf("%w: %v", ErrInvalidPath, err)
 	}
 
-	handler := jsonhandler.NewJSONHandler(filePath)
-	data, err := handler.LoadJSON(true)
-	if err != nil {
-		return err
-	}
+	return nil
+}
 
-	// Check if old key exists
-	if !pathresolver.KeyExists(data, oldPath) {
+// renameKeyInData moves a value to a new path in already loaded data.
+// The paths must have been checked with validateRenamePaths.
+func renameKeyInData(data map[string]interface{}, filePath, oldPath, newPath string) error {
+	// Find the old key once; its parent is reused to unlink it below
+	oldParent, oldKey, found := pathresolver.LocateKey(data, oldPath)
+	if !found {
 		return fmt.Errorf("%w: Key '%s' not found in %s", ErrKeyNotFound, oldPath, filePath)
 	}
 
-	// Check if new key already exists
-	if pathresolver.KeyExists(data, newPath) {
-		return fmt.Errorf("%w: Key '%s' already exists in %s", ErrKeyExists, newPath, filePath)
+	// Renaming within the same object, the common case, relinks the value in
+	// the parent already found instead of walking to the new location. This
+	// only applies when the old key was reached by dot navigation, not as a
+	// root key containing dots.
+	oldParentPath, oldLast := splitLastSegment(oldPath)
+	newParentPath, newLast := splitLastSegment(newPath)
+	if oldKey == oldLast && oldParentPath == newParentPath && newLast != "" {
+		_, literalExists := data[newPath]
+		if _, exists := oldParent[newLast]; exists || literalExists {
+			return fmt.Errorf("%w: Key '%s' already exists in %s", ErrKeyExists, newPath, filePath)
+		}
+		oldParent[newLast] = oldParent[oldKey]
+		delete(oldParent, oldKey)
+		return nil
 	}
 
-	// Get the value from old location
-	value, err := pathresolver.NavigateToKey(data, oldPath)
+	// Set value at new location (create path if needed), failing if taken
+	err := pathresolver.AddValueAtPath(data, newPath, oldParent[oldKey])
 	if err != nil {
-		return fmt.Errorf("%w: Failed to get value at '%s': %v", ErrRenameKeyError, oldPath, err)
+		if errors.Is(err, pathresolver.ErrKeyExists) {
+			return fmt.Errorf("%w: Key '%s' already exists in %s", ErrKeyExists, newPath, filePath)
+		}
+		return fmt.Errorf("%w: Failed to set value at '%s': %v", ErrRenameKeyError, newPath, err)
 	}
 
-	// Set value at new location (create path if needed)
-	err = pathresolver.SetValueAtPath(data, newPath, value, true)
+	// Remove from old location
+	delete(oldParent, oldKey)
+	return nil
+}
+
+// RemoveKey removes key and returns its value
+func RemoveKey(filePath, keyPath string) (interface{}, error) {
+	handler := jsonhandler.NewJSONHandler(filePath)
+	unlock := handler.LockUpdates()
+	defer unlock()
+
+	data, err := handler.LoadJSONForUpdate()
 	if err != nil {
-		return fmt.Errorf("%w: Failed to set value at '%s': %v", ErrRenameKeyError, newPath, err)
+		return nil, err
 	}
 
-	// Remove from old location
-	_, err = pathresolver.RemoveKeyAtPath(data, oldPath)
+	removedValue, err := removeKeyFromData(data, filePath, keyPath)
 	if err != nil {
-		return fmt.Errorf("%w: Failed to remove old key '%s': %v", ErrRenameKeyError, oldPath, err)
+		return nil, err
 	}
 
 	// Save the updated data
 	if err := handler.SaveJSON(data, 2); err != nil {
-		return fmt.Errorf("%w: Failed to save file: %v", ErrRenameKeyError, err)
+		return nil, fmt.Errorf("%w: Failed to save file: %v", ErrRemoveKeyError, err)
 	}
 
-	return nil
+	return removedValue, nil
 }
 
-// RemoveKey removes key and returns its value
-func RemoveKey(filePath, keyPath string) (interface{}, error) {
-	handler := jsonhandler.NewJSONHandler(filePath)
-	data, err := handler.LoadJSON(true)
-	if err != nil {
-		return nil, err
+// splitLastSegment splits a key path into its parent path and final segment
+func splitLastSegment(keyPath string) (string, string) {
+	dot := strings.LastIndexByte(keyPath, '.')
+	if dot < 0 {
+		return "", keyPath
 	}
+	return keyPath[:dot], keyPath[dot+1:]
+}
 
+// removeKeyFromData removes a key from already loaded data and returns its value
+func removeKeyFromData(data map[string]interface{}, filePath, keyPath string) (interface{}, error) {
 	// Validate path first
 	if err := pathresolver.ValidatePath(keyPath); err != nil {
 		return nil, fmt.Errorf("%w: %v", ErrInvalidPath, err)
 	}
 
-	// Check if key exists
-	if !pathresolver.KeyExists(data, keyPath) {
+	// Find the key and remove it with a single walk
+	parent, key, found := pathresolver.LocateKey(data, keyPath)
+	if !found {
 		return nil, fmt.Errorf("%w: Key '%s' not found in %s", ErrKeyNotFound, keyPath, filePath)
 	}
 
-	// Remove the key and get its value
-	removedValue, err := pathresolver.RemoveKeyAtPath(data, keyPath)
-	if err != nil {
-		return nil, fmt.Errorf("%w: Failed to remove key '%s': %v", ErrRemoveKeyError, keyPath, err)
-	}
-
-	// Save the updated data
-	if err := handler.SaveJSON(data, 2); err != nil {
-		return nil, fmt.Errorf("%w: Failed to save file: %v", ErrRemoveKeyError, err)
-	}
-
+	removedValue := parent[key]
+	delete(parent, key)
 	return removedValue, nil
 }
 
@@ -205,6 +308,11 @@ func ListKeys(filePath string, keyPath *string) ([]string, error) {
 		return nil, err
 	}
 
+	return listKeysInData(data, filePath, keyPath)
+}
+
+// listKeysInData lists the child keys at a path in already loaded data
+func listKeysInData(data map[string]interface{}, filePath string, keyPath *string) ([]string, error) {
 	keys, err := pathresolver.GetAllKeysAtPath(data, keyPath)
 	if err != nil {
 		if errors.Is(err, pathresolver.ErrKeyNotFound) {
@@ -226,6 +334,21 @@ func ListKeys(filePath string, keyPath *string) ([]string, error) {
 // KeyExists checks if a key exists at the specified path
 func KeyExists(filePath, keyPath string) (bool, error) {
 	handler := jsonhandler.NewJSONHandler(filePath)
+
+	// Large uncached files: scan for the key instead of decoding the document
+	// on the first check; a repeat check parses and caches the file. A scan
+	// that completes without error has seen a valid document, so a miss is as
+	// reliable as one from the parsed tree.
+	exists := false
+	streamed, err := handler.StreamUncached(streamingLookupThreshold, func(r io.Reader) error {
+		var streamErr error
+		_, exists, streamErr = pathresolver.StreamToKey(r, keyPath)
+		return streamErr
+	})
+	if streamed && err == nil {
+		return exists, nil
+	}
+
 	data, err := handler.LoadJSON(true)
 	if err != nil {
 		return false, err
@@ -245,22 +368,12 @@ type ValidationResult struct {
 
 // ValidateJSON validates JSON file syntax and structure
 func ValidateJSON(filePath string) (*ValidationResult, error) {
-	startTime := time.Now()
 	handler := jsonhandler.NewJSONHandler(filePath)
 
-	// Get basic file info
-	fileInfo := handler.GetFileInfo()
-	
+	// The file size comes from the descriptor the syntax check reads, and
+	// the parse time from the monotonic clock; no separate stat is needed
 	result := handler.ValidateJSONSyntax()
 
-	// Add performance metrics if valid
-	if result.Valid && result.Performance != nil {
-		result.Performance.ParseTime = time.Since(startTime).Seconds()
-		if fileInfo.Exists {
-			result.Performance.FileSize = fileInfo.SizeBytes
-		}
-	}
-
 	// Convert to our result type
 	validationResult := &ValidationResult{
 		Valid:       result.Valid,
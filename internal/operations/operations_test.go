@@ -2,8 +2,16 @@ package operations
 
 import (
 	"encoding/json"
+	"errors"
+	"fmt"
+	"io"
 	"os"
+	"path/filepath"
+	"strconv"
+	"sync"
 	"testing"
+
+	"jsonmcptool/internal/jsonhandler"
 )
 
 // Test data similar to original Python fixtures
@@ -76,14 +84,15 @@ var simpleTestData = map[string]interface{}{
 }
 
 func TestGetKey(t *testing.T) {
+	t.Parallel()
+
 	tempFile := createTempJSONFile(t, sampleI18nData)
-	defer os.Remove(tempFile)
 
 	tests := []struct {
 		name    string
 		path    string
 		want    interface{}
-		wantErr bool
+		wantErr error
 	}{
 		{
 			name: "simple nested key",
@@ -107,23 +116,23 @@ func TestGetKey(t *testing.T) {
 		{
 			name:    "nonexistent key",
 			path:    "nonexistent.key",
-			wantErr: true,
+			wantErr: ErrKeyNotFound,
 		},
 		{
 			name:    "empty path",
 			path:    "",
-			wantErr: true,
+			wantErr: ErrInvalidPath,
 		},
 	}
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
 			result, err := GetKey(tempFile, tt.path)
-			if (err != nil) != tt.wantErr {
+			if !errors.Is(err, tt.wantErr) {
 				t.Errorf("GetKey() error = %v, wantErr %v", err, tt.wantErr)
 				return
 			}
-			if !tt.wantErr {
+			if tt.wantErr == nil {
 				if !deepEqual(result, tt.want) {
 					t.Errorf("GetKey() = %v, want %v", result, tt.want)
 				}
@@ -133,8 +142,9 @@ func TestGetKey(t *testing.T) {
 }
 
 func TestGetKeyWithDottedKeys(t *testing.T) {
+	t.Parallel()
+
 	tempFile := createTempJSONFile(t, simpleTestData)
-	defer os.Remove(tempFile)
 
 	// Test key that contains dots in its name
 	result, err := GetKey(tempFile, "key.with.dots")
@@ -148,8 +158,9 @@ func TestGetKeyWithDottedKeys(t *testing.T) {
 }
 
 func TestGetKeyDifferentDataTypes(t *testing.T) {
+	t.Parallel()
+
 	tempFile := createTempJSONFile(t, simpleTestData)
-	defer os.Remove(tempFile)
 
 	tests := []struct {
 		name string
@@ -180,16 +191,100 @@ func TestGetKeyDifferentDataTypes(t *testing.T) {
 	}
 }
 
+func TestGetKeyLargeFile(t *testing.T) {
+	t.Parallel()
+
+	tempFile := createLargeTestFile(t)
+
+	if info, err := os.Stat(tempFile); err != nil || info.Size() < streamingLookupThreshold {
+		t.Fatalf("test file should exceed the streaming threshold")
+	}
+
+	result, err := GetKey(tempFile, "section_150.item_42")
+	if err != nil {
+		t.Fatalf("GetKey() error = %v", err)
+	}
+	if result != "Translation text for section 150 item 42" {
+		t.Errorf("GetKey() = %v, want section 150 item 42 text", result)
+	}
+
+	result, err = GetKey(tempFile, "key.with.dots")
+	if err != nil {
+		t.Fatalf("GetKey() error = %v", err)
+	}
+	if result != "dotted key value" {
+		t.Errorf("GetKey() = %v, want 'dotted key value'", result)
+	}
+
+	// Only the first read streams; the second parsed and cached the file
+	streamed, err := jsonhandler.NewJSONHandler(tempFile).StreamUncached(streamingLookupThreshold, func(r io.Reader) error {
+		return nil
+	})
+	if err != nil || streamed {
+		t.Errorf("StreamUncached() = %v, %v, want the file cached after repeated reads", streamed, err)
+	}
+
+	if _, err := GetKey(tempFile, "section_150.missing"); err == nil {
+		t.Error("GetKey() should fail for a missing key in a large file")
+	}
+}
+
+func TestKeyExistsLargeFile(t *testing.T) {
+	t.Parallel()
+
+	tempFile := createLargeTestFile(t)
+
+	tests := []struct {
+		path string
+		want bool
+	}{
+		{"section_150.item_42", true},
+		{"key.with.dots", true},
+		{"section_150", true},
+		{"section_150.missing", false},
+		{"missing.key", false},
+		{"section_150.item_42.deeper", false},
+		{"", false},
+	}
+
+	for _, tt := range tests {
+		exists, err := KeyExists(tempFile, tt.path)
+		if err != nil {
+			t.Fatalf("KeyExists(%q) error = %v", tt.path, err)
+		}
+		if exists != tt.want {
+			t.Errorf("KeyExists(%q) = %v, want %v", tt.path, exists, tt.want)
+		}
+	}
+
+	// Repeated checks parse and cache the file instead of scanning it again
+	streamed, err := jsonhandler.NewJSONHandler(tempFile).StreamUncached(streamingLookupThreshold, func(r io.Reader) error {
+		return nil
+	})
+	if err != nil || streamed {
+		t.Errorf("StreamUncached() = %v, %v, want the file cached after repeated checks", streamed, err)
+	}
+
+	// Invalid JSON is still reported as an error
+	if err := os.WriteFile(tempFile, append(make([]byte, streamingLookupThreshold), '{'), 0644); err != nil {
+		t.Fatal(err)
+	}
+	if _, err := KeyExists(tempFile, "section_150"); err == nil {
+		t.Error("KeyExists() should fail for invalid JSON")
+	}
+}
+
 func TestAddKey(t *testing.T) {
+	t.Parallel()
+
 	// Start with sample data
 	tempFile := createTempJSONFile(t, sampleI18nData)
-	defer os.Remove(tempFile)
 
 	tests := []struct {
 		name    string
 		path    string
 		value   interface{}
-		wantErr bool
+		wantErr error
 	}{
 		{
 			name:  "add new simple key",
@@ -208,25 +303,31 @@ func TestAddKey(t *testing.T) {
 			name:    "add existing key should fail",
 			path:    "dashboard.title",
 			value:   "Should Fail",
-			wantErr: true,
+			wantErr: ErrKeyExists,
 		},
 		{
 			name:    "empty path should fail",
 			path:    "",
 			value:   "value",
-			wantErr: true,
+			wantErr: ErrAddKeyError,
+		},
+		{
+			name:    "empty segment should fail",
+			path:    "modals..title",
+			value:   "value",
+			wantErr: ErrAddKeyError,
 		},
 	}
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
 			err := AddKey(tempFile, tt.path, tt.value)
-			if (err != nil) != tt.wantErr {
+			if !errors.Is(err, tt.wantErr) {
 				t.Errorf("AddKey() error = %v, wantErr %v", err, tt.wantErr)
 			}
 
 			// Verify key was added if no error expected
-			if !tt.wantErr {
+			if tt.wantErr == nil {
 				result, err := GetKey(tempFile, tt.path)
 				if err != nil {
 					t.Errorf("Failed to verify added key: %v", err)
@@ -240,15 +341,49 @@ func TestAddKey(t *testing.T) {
 	}
 }
 
+func TestAddKeyConcurrent(t *testing.T) {
+	t.Parallel()
+
+	tempFile := createTempJSONFile(t, sampleI18nData)
+
+	// Prime the shared cache so writers start from copies of cached data
+	if _, err := GetKey(tempFile, "dashboard.title"); err != nil {
+		t.Fatal(err)
+	}
+
+	const writers = 20
+	var wg sync.WaitGroup
+	for i := 0; i < writers; i++ {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			if err := AddKey(tempFile, fmt.Sprintf("concurrent.key%d", i), i); err != nil {
+				t.Errorf("AddKey() error = %v", err)
+			}
+		}(i)
+	}
+	wg.Wait()
+
+	// No update may be lost to a concurrent read-modify-write
+	keys, err := ListKeys(tempFile, stringPtr("concurrent"))
+	if err != nil {
+		t.Fatal(err)
+	}
+	if len(keys) != writers {
+		t.Errorf("ListKeys() returned %d keys, want %d", len(keys), writers)
+	}
+}
+
 func TestUpdateKey(t *testing.T) {
+	t.Parallel()
+
 	tempFile := createTempJSONFile(t, sampleI18nData)
-	defer os.Remove(tempFile)
 
 	tests := []struct {
 		name    string
 		path    string
 		value   interface{}
-		wantErr bool
+		wantErr error
 	}{
 		{
 			name:  "update existing key",
@@ -266,19 +401,19 @@ func TestUpdateKey(t *testing.T) {
 			name:    "update nonexistent key should fail",
 			path:    "nonexistent.key",
 			value:   "Should Fail",
-			wantErr: true,
+			wantErr: ErrKeyNotFound,
 		},
 	}
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
 			err := UpdateKey(tempFile, tt.path, tt.value)
-			if (err != nil) != tt.wantErr {
+			if !errors.Is(err, tt.wantErr) {
 				t.Errorf("UpdateKey() error = %v, wantErr %v", err, tt.wantErr)
 			}
 
 			// Verify key was updated if no error expected
-			if !tt.wantErr {
+			if tt.wantErr == nil {
 				result, err := GetKey(tempFile, tt.path)
 				if err != nil {
 					t.Errorf("Failed to verify updated key: %v", err)
@@ -292,15 +427,151 @@ func TestUpdateKey(t *testing.T) {
 	}
 }
 
+func TestUpdateAndRemoveDottedKey(t *testing.T) {
+	t.Parallel()
+
+	tempFile := createTempJSONFile(t, simpleTestData)
+
+	// Keys containing dots resolve the same way for writes as for GetKey
+	if err := UpdateKey(tempFile, "key.with.dots", "updated"); err != nil {
+		t.Fatalf("UpdateKey() error = %v", err)
+	}
+	result, err := GetKey(tempFile, "key.with.dots")
+	if err != nil || result != "updated" {
+		t.Errorf("GetKey() = %v, %v, want 'updated'", result, err)
+	}
+
+	removed, err := RemoveKey(tempFile, "key.with.dots")
+	if err != nil || removed != "updated" {
+		t.Errorf("RemoveKey() = %v, %v, want 'updated'", removed, err)
+	}
+	if exists, _ := KeyExists(tempFile, "key.with.dots"); exists {
+		t.Error("KeyExists() = true after RemoveKey()")
+	}
+}
+
+func TestLiteralKeyWithEmptySegments(t *testing.T) {
+	t.Parallel()
+
+	tempFile := createTempJSONFile(t, map[string]interface{}{
+		"Loading...": "Loading...",
+		"nav":        map[string]interface{}{"home": "Home"},
+	})
+
+	// Root keys matching the whole path are reachable even though the path
+	// would have empty segments under dot navigation
+	result, err := GetKey(tempFile, "Loading...")
+	if err != nil || result != "Loading..." {
+		t.Errorf("GetKey() = %v, %v, want 'Loading...'", result, err)
+	}
+	if exists, err := KeyExists(tempFile, "Loading..."); err != nil || !exists {
+		t.Errorf("KeyExists() = %v, %v, want true", exists, err)
+	}
+	if err := AddKey(tempFile, "Loading...", "again"); !errors.Is(err, ErrKeyExists) {
+		t.Errorf("AddKey() error = %v, want %v", err, ErrKeyExists)
+	}
+	if err := UpdateKey(tempFile, "Loading...", "Loading…"); err != nil {
+		t.Errorf("UpdateKey() error = %v", err)
+	}
+	removed, err := RemoveKey(tempFile, "Loading...")
+	if err != nil || removed != "Loading…" {
+		t.Errorf("RemoveKey() = %v, %v, want 'Loading…'", removed, err)
+	}
+
+	// Without a literal match, empty segments are still rejected
+	if _, err := GetKey(tempFile, "Loading..."); !errors.Is(err, ErrInvalidPath) {
+		t.Errorf("GetKey() error = %v, want %v", err, ErrInvalidPath)
+	}
+	if exists, _ := KeyExists(tempFile, "nav..home"); exists {
+		t.Error("KeyExists() = true for a path with an empty segment")
+	}
+	if err := RenameKey(tempFile, "nav.home", "nav."); !errors.Is(err, ErrRenameKeyError) {
+		t.Errorf("RenameKey() error = %v, want %v", err, ErrRenameKeyError)
+	}
+}
+
+func TestUpdateKeyLargeFile(t *testing.T) {
+	t.Parallel()
+
+	largeData := buildLargeTestData()
+	tempFile := createTempJSONFile(t, largeData)
+
+	updates := []struct {
+		path  string
+		value interface{}
+	}{
+		{"section_150.item_42", "Updated text"},
+		{"section_3.item_7", map[string]interface{}{"one": "1 item", "other": "{{count}} items"}},
+		{"section_99", []interface{}{"a", float64(1)}},
+	}
+
+	for _, update := range updates {
+		if err := UpdateKey(tempFile, update.path, update.value); err != nil {
+			t.Fatalf("UpdateKey(%s) error = %v", update.path, err)
+		}
+
+		result, err := GetKey(tempFile, update.path)
+		if err != nil {
+			t.Fatalf("GetKey(%s) error = %v", update.path, err)
+		}
+		if !deepEqual(result, update.value) {
+			t.Errorf("GetKey(%s) = %v, want %v", update.path, result, update.value)
+		}
+	}
+
+	// Only the edited values change; the rest keeps its original layout
+	largeData["section_150"].(map[string]interface{})["item_42"] = updates[0].value
+	largeData["section_3"].(map[string]interface{})["item_7"] = updates[1].value
+	largeData["section_99"] = updates[2].value
+	want, err := json.MarshalIndent(largeData, "", "  ")
+	if err != nil {
+		t.Fatal(err)
+	}
+	got, err := os.ReadFile(tempFile)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if string(got) != string(want) {
+		t.Error("UpdateKey() on a large file should only rewrite the edited values")
+	}
+}
+
+func TestUpdateKeyLargeFileDuplicateKeys(t *testing.T) {
+	t.Parallel()
+
+	// A parse keeps the last of duplicate keys, so the splice must edit that one
+	content, err := json.MarshalIndent(buildLargeTestData(), "", "  ")
+	if err != nil {
+		t.Fatal(err)
+	}
+	content = append([]byte(`{
+  "dup": "first",
+  "dup": "second",`), content[1:]...)
+	tempFile := writeTempJSONFile(t, content)
+
+	if err := UpdateKey(tempFile, "dup", "updated"); err != nil {
+		t.Fatalf("UpdateKey() error = %v", err)
+	}
+
+	data, err := jsonhandler.NewJSONHandler(tempFile).LoadJSON(false)
+	if err != nil {
+		t.Fatalf("LoadJSON() error = %v", err)
+	}
+	if data["dup"] != "updated" {
+		t.Errorf("dup = %v after UpdateKey(), want 'updated'", data["dup"])
+	}
+}
+
 func TestRenameKey(t *testing.T) {
+	t.Parallel()
+
 	tempFile := createTempJSONFile(t, sampleI18nData)
-	defer os.Remove(tempFile)
 
 	tests := []struct {
 		name     string
 		oldPath  string
 		newPath  string
-		wantErr  bool
+		wantErr  error
 		expected interface{}
 	}{
 		{
@@ -315,34 +586,40 @@ func TestRenameKey(t *testing.T) {
 			newPath:  "common.validation",
 			expected: sampleI18nData["forms"].(map[string]interface{})["validation"],
 		},
+		{
+			name:     "rename root level key",
+			oldPath:  "navigation",
+			newPath:  "nav",
+			expected: sampleI18nData["navigation"],
+		},
 		{
 			name:    "rename nonexistent key should fail",
 			oldPath: "nonexistent.key",
 			newPath: "new.key",
-			wantErr: true,
+			wantErr: ErrKeyNotFound,
 		},
 		{
 			name:    "rename to existing key should fail",
 			oldPath: "alerts.success",
 			newPath: "alerts.error",
-			wantErr: true,
+			wantErr: ErrKeyExists,
 		},
 		{
 			name:    "same old and new path should fail",
 			oldPath: "dashboard.title",
 			newPath: "dashboard.title",
-			wantErr: true,
+			wantErr: ErrSameKey,
 		},
 	}
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
 			err := RenameKey(tempFile, tt.oldPath, tt.newPath)
-			if (err != nil) != tt.wantErr {
+			if !errors.Is(err, tt.wantErr) {
 				t.Errorf("RenameKey() error = %v, wantErr %v", err, tt.wantErr)
 			}
 
-			if !tt.wantErr {
+			if tt.wantErr == nil {
 				// Verify old key no longer exists
 				exists, _ := KeyExists(tempFile, tt.oldPath)
 				if exists {
@@ -364,13 +641,14 @@ func TestRenameKey(t *testing.T) {
 }
 
 func TestRemoveKey(t *testing.T) {
+	t.Parallel()
+
 	tempFile := createTempJSONFile(t, sampleI18nData)
-	defer os.Remove(tempFile)
 
 	tests := []struct {
 		name     string
 		path     string
-		wantErr  bool
+		wantErr  error
 		expected interface{}
 	}{
 		{
@@ -386,18 +664,18 @@ func TestRemoveKey(t *testing.T) {
 		{
 			name:    "remove nonexistent key should fail",
 			path:    "nonexistent.key",
-			wantErr: true,
+			wantErr: ErrKeyNotFound,
 		},
 	}
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
 			result, err := RemoveKey(tempFile, tt.path)
-			if (err != nil) != tt.wantErr {
+			if !errors.Is(err, tt.wantErr) {
 				t.Errorf("RemoveKey() error = %v, wantErr %v", err, tt.wantErr)
 			}
 
-			if !tt.wantErr {
+			if tt.wantErr == nil {
 				// Verify returned value is correct
 				if !deepEqual(result, tt.expected) {
 					t.Errorf("RemoveKey() returned = %v, want %v", result, tt.expected)
@@ -414,8 +692,9 @@ func TestRemoveKey(t *testing.T) {
 }
 
 func TestListKeys(t *testing.T) {
+	t.Parallel()
+
 	tempFile := createTempJSONFile(t, sampleI18nData)
-	defer os.Remove(tempFile)
 
 	tests := []struct {
 		name     string
@@ -463,8 +742,9 @@ func TestListKeys(t *testing.T) {
 }
 
 func TestKeyExists(t *testing.T) {
+	t.Parallel()
+
 	tempFile := createTempJSONFile(t, sampleI18nData)
-	defer os.Remove(tempFile)
 
 	tests := []struct {
 		name string
@@ -493,9 +773,10 @@ func TestKeyExists(t *testing.T) {
 }
 
 func TestValidateJSON(t *testing.T) {
+	t.Parallel()
+
 	// Valid JSON file
 	validFile := createTempJSONFile(t, sampleI18nData)
-	defer os.Remove(validFile)
 
 	result, err := ValidateJSON(validFile)
 	if err != nil {
@@ -510,19 +791,9 @@ func TestValidateJSON(t *testing.T) {
 	}
 
 	// Invalid JSON file
-	invalidFile, err := os.CreateTemp("", "invalid_*.json")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer os.Remove(invalidFile.Name())
+	invalidFile := writeTempJSONFile(t, []byte("{invalid json"))
 
-	_, err = invalidFile.WriteString("{invalid json")
-	if err != nil {
-		t.Fatal(err)
-	}
-	invalidFile.Close()
-
-	result, err = ValidateJSON(invalidFile.Name())
+	result, err = ValidateJSON(invalidFile)
 	if err != nil {
 		t.Errorf("ValidateJSON() should not return error for invalid JSON: %v", err)
 		return
@@ -536,6 +807,8 @@ func TestValidateJSON(t *testing.T) {
 }
 
 func TestFileNotFoundErrors(t *testing.T) {
+	t.Parallel()
+
 	nonexistentFile := "nonexistent.json"
 
 	// Test all operations with nonexistent file
@@ -578,23 +851,64 @@ func TestFileNotFoundErrors(t *testing.T) {
 // Helper functions
 
 func createTempJSONFile(t *testing.T, data map[string]interface{}) string {
-	tempFile, err := os.CreateTemp("", "test_*.json")
+	jsonData, err := json.MarshalIndent(data, "", "  ")
 	if err != nil {
 		t.Fatal(err)
 	}
 
-	jsonData, err := json.MarshalIndent(data, "", "  ")
-	if err != nil {
+	return writeTempJSONFile(t, jsonData)
+}
+
+// writeTempJSONFile writes content to a file in a per-test directory that
+// the testing package removes when the test and its subtests finish
+func writeTempJSONFile(t *testing.T, content []byte) string {
+	tempFile := filepath.Join(t.TempDir(), "test.json")
+	if err := os.WriteFile(tempFile, content, 0644); err != nil {
 		t.Fatal(err)
 	}
+	return tempFile
+}
 
-	_, err = tempFile.Write(jsonData)
-	if err != nil {
-		t.Fatal(err)
+// largeTestJSON holds the encoded buildLargeTestData document, built once
+// and shared by every test that only needs the file contents
+var largeTestJSON struct {
+	once sync.Once
+	data []byte
+	err  error
+}
+
+// createLargeTestFile writes the large test document to a new temp file
+func createLargeTestFile(t *testing.T) string {
+	largeTestJSON.once.Do(func() {
+		largeTestJSON.data, largeTestJSON.err = json.MarshalIndent(buildLargeTestData(), "", "  ")
+	})
+	if largeTestJSON.err != nil {
+		t.Fatal(largeTestJSON.err)
+	}
+
+	return writeTempJSONFile(t, largeTestJSON.data)
+}
+
+// buildLargeTestData returns translations large enough to exceed streamingLookupThreshold
+func buildLargeTestData() map[string]interface{} {
+	largeData := map[string]interface{}{
+		"key.with.dots": "dotted key value",
+	}
+	// Item keys repeat in every section, so format them once
+	itemKeys := make([]string, 100)
+	for j := range itemKeys {
+		itemKeys[j] = "item_" + strconv.Itoa(j)
 	}
 
-	tempFile.Close()
-	return tempFile.Name()
+	for i := 0; i < 200; i++ {
+		prefix := "Translation text for section " + strconv.Itoa(i) + " item "
+		section := make(map[string]interface{}, len(itemKeys))
+		for j, itemKey := range itemKeys {
+			section[itemKey] = prefix + strconv.Itoa(j)
+		}
+		largeData["section_"+strconv.Itoa(i)] = section
+	}
+	return largeData
 }
 
 func stringPtr(s string) *string {
@@ -615,25 +929,17 @@ func sliceContainsSameElements(a, b []string) bool {
 		return false
 	}
 
-	aMap := make(map[string]bool)
-	bMap := make(map[string]bool)
-
+	// Count occurrences in a and consume them with b, so duplicates must match
+	// too and the first surplus element ends the comparison
+	counts := make(map[string]int, len(a))
 	for _, v := range a {
-		aMap[v] = true
+		counts[v]++
 	}
 	for _, v := range b {
-		bMap[v] = true
-	}
-
-	for k := range aMap {
-		if !bMap[k] {
-			return false
-		}
-	}
-	for k := range bMap {
-		if !aMap[k] {
+		if counts[v] == 0 {
 			return false
 		}
+		counts[v]--
 	}
 
 	return true
@@ -1,9 +1,13 @@
 package pathresolver
 
 import (
+	"bytes"
+	"encoding/json"
 	"errors"
 	"fmt"
+	"io"
 	"strings"
+	"sync"
 )
 
 var (
@@ -12,6 +16,7 @@ var (
 	ErrPathError     = errors.New("PATH_ERROR")
 	ErrPathConflict  = errors.New("PATH_CONFLICT")
 	ErrNotObject     = errors.New("NOT_OBJECT")
+	ErrKeyExists     = errors.New("KEY_EXISTS")
 )
 
 // ValidatePath validates a key path
@@ -22,6 +27,22 @@ func ValidatePath(keyPath string) error {
 	return nil
 }
 
+// validateSegments rejects a path with empty segments before it is followed
+// or created by dot navigation, where they would split into "" keys. Root
+// keys matching the whole path, such as "Loading...", are looked up before
+// this check and stay reachable.
+func validateSegments(keyPath string) error {
+	if hasEmptySegment(keyPath) {
+		return fmt.Errorf("%w: Key path '%s' contains an empty segment", ErrInvalidPath, keyPath)
+	}
+	return nil
+}
+
+// hasEmptySegment reports whether splitting keyPath on dots yields an empty key
+func hasEmptySegment(keyPath string) bool {
+	return keyPath[0] == '.' || keyPath[len(keyPath)-1] == '.' || strings.Contains(keyPath, "..")
+}
+
 // SplitPath splits a dot-notation path into individual keys
 func SplitPath(keyPath string) []string {
 	if keyPath == "" {
@@ -30,6 +51,36 @@ func SplitPath(keyPath string) []string {
 	return strings.Split(keyPath, ".")
 }
 
+// compiledPathLimit caps the number of memoized paths; the cache is reset once full
+const compiledPathLimit = 4096
+
+var (
+	compiledPaths      = make(map[string][]string)
+	compiledPathsMutex sync.RWMutex
+)
+
+// compilePath returns the memoized segments of a dot-notation path.
+// The returned slice is shared between callers and must not be modified.
+func compilePath(keyPath string) []string {
+	compiledPathsMutex.RLock()
+	keys, ok := compiledPaths[keyPath]
+	compiledPathsMutex.RUnlock()
+	if ok {
+		return keys
+	}
+
+	keys = SplitPath(keyPath)
+
+	compiledPathsMutex.Lock()
+	if len(compiledPaths) >= compiledPathLimit {
+		compiledPaths = make(map[string][]string)
+	}
+	compiledPaths[keyPath] = keys
+	compiledPathsMutex.Unlock()
+
+	return keys
+}
+
 // NavigateToKey navigates through nested structure to get value at key path
 func NavigateToKey(data interface{}, keyPath string) (interface{}, error) {
 	if err := ValidatePath(keyPath); err != nil {
@@ -47,52 +98,208 @@ func NavigateToKey(data interface{}, keyPath string) (interface{}, error) {
 		return value, nil
 	}
 
+	// A key without dots has nothing further to navigate
+	if strings.IndexByte(keyPath, '.') < 0 {
+		return nil, fmt.Errorf("%w: Key '%s' not found", ErrKeyNotFound, keyPath)
+	}
+
 	// If that fails, try dot-separated navigation
-	keys := SplitPath(keyPath)
-	current := data
+	if err := validateSegments(keyPath); err != nil {
+		return nil, err
+	}
+	return navigateKeys(data, keyPath, compilePath(keyPath))
+}
+
+// navigateKeys follows already split keys from data, reporting failures
+// against keyPath
+func navigateKeys(data interface{}, keyPath string, keys []string) (interface{}, error) {
+	node, depth, found := walkKeys(data, keys)
+	if found {
+		return node, nil
+	}
+
+	if _, ok := node.(map[string]interface{}); !ok {
+		partialPath := strings.Join(keys[:depth], ".")
+		return nil, fmt.Errorf("%w: Cannot navigate through non-object value at '%s'", ErrPathError, partialPath)
+	}
+	return nil, fmt.Errorf("%w: Key '%s' not found", ErrKeyNotFound, keyPath)
+}
 
+// walkKeys follows keys from current. On success it returns the value found;
+// otherwise it returns the node where the walk stopped and its depth, so
+// callers that only need a yes/no answer never build an error.
+func walkKeys(current interface{}, keys []string) (interface{}, int, bool) {
 	for i, key := range keys {
 		currentMap, ok := current.(map[string]interface{})
 		if !ok {
-			partialPath := strings.Join(keys[:i], ".")
-			return nil, fmt.Errorf("%w: Cannot navigate through non-object value at '%s'", ErrPathError, partialPath)
+			return current, i, false
 		}
 
 		value, exists := currentMap[key]
 		if !exists {
-			return nil, fmt.Errorf("%w: Key '%s' not found", ErrKeyNotFound, keyPath)
+			return current, i, false
 		}
 
 		current = value
 	}
 
+	return current, len(keys), true
+}
+
+// streamedValue is an object member value captured while scanning a document
+type streamedValue struct {
+	raw    json.RawMessage
+	offset int64
+	found  bool
+}
+
+// StreamToKey resolves a key path by scanning the JSON document in r instead of
+// decoding it into a tree, following the same rules as NavigateToKey. Only the
+// raw bytes of the matched value are kept. The boolean result is false when
+// the path cannot be resolved; callers fall back to a full parse for errors.
+func StreamToKey(r io.Reader, keyPath string) (json.RawMessage, bool, error) {
+	value, err := streamToValue(r, keyPath)
+	if err != nil || !value.found {
+		return nil, false, err
+	}
+	return value.raw, true, nil
+}
+
+// LocateValue returns the byte offset and length of the value at keyPath in
+// the JSON document read from r, resolved like LocateKey: a root key matching
+// the whole path wins over dot navigation. ok is false if there is no value.
+func LocateValue(r io.Reader, keyPath string) (offset, length int64, ok bool, err error) {
+	value, err := streamToValue(r, keyPath)
+	if err != nil || !value.found {
+		return 0, 0, false, err
+	}
+
+	return value.offset, int64(len(value.raw)), true, nil
+}
+
+// streamToValue scans r for the value at keyPath
+func streamToValue(r io.Reader, keyPath string) (streamedValue, error) {
+	if err := ValidatePath(keyPath); err != nil {
+		return streamedValue{}, err
+	}
+
+	keys := compilePath(keyPath)
+	decoder := json.NewDecoder(r)
+
+	// At the root, the whole path as a single key wins over dot navigation
+	var literal, first streamedValue
+	err := scanObject(decoder, func(key string) *streamedValue {
+		if key == keyPath {
+			return &literal
+		}
+		if key == keys[0] {
+			return &first
+		}
+		return nil
+	})
+	if err != nil {
+		return streamedValue{}, err
+	}
+
+	// Reject trailing data, as a full parse would
+	if _, err := decoder.Token(); err != io.EOF {
+		return streamedValue{}, fmt.Errorf("%w: Unexpected data after root object", ErrPathError)
+	}
+
+	if literal.found {
+		return literal, nil
+	}
+	if !first.found || len(keys) == 1 || hasEmptySegment(keyPath) {
+		return streamedValue{}, nil
+	}
+
+	current := first
+	for _, key := range keys[1:] {
+		var next streamedValue
+		err := scanObject(json.NewDecoder(bytes.NewReader(current.raw)), func(name string) *streamedValue {
+			if name == key {
+				return &next
+			}
+			return nil
+		})
+		if err != nil || !next.found {
+			return streamedValue{}, nil
+		}
+		next.offset += current.offset
+		current = next
+	}
+
 	return current, nil
 }
 
+// scanObject walks the members of the next JSON object in decoder. Values are
+// captured into the target returned by visit, or skipped when it returns nil.
+// Later duplicates overwrite earlier ones, matching json.Unmarshal.
+func scanObject(decoder *json.Decoder, visit func(key string) *streamedValue) error {
+	token, err := decoder.Token()
+	if err != nil {
+		return err
+	}
+	if delim, ok := token.(json.Delim); !ok || delim != '{' {
+		return fmt.Errorf("%w: Value is not an object", ErrNotObject)
+	}
+
+	var skipped streamedValue
+	for decoder.More() {
+		token, err := decoder.Token()
+		if err != nil {
+			return err
+		}
+		key, _ := token.(string)
+
+		target := visit(key)
+		if target == nil {
+			target = &skipped
+		}
+		if err := decoder.Decode(&target.raw); err != nil {
+			return err
+		}
+		target.offset = decoder.InputOffset() - int64(len(target.raw))
+		target.found = true
+	}
+
+	// Consume the closing brace
+	_, err = decoder.Token()
+	return err
+}
+
 // NavigateToParent navigates to the parent of the target key
 func NavigateToParent(data interface{}, keyPath string) (map[string]interface{}, string, error) {
 	if err := ValidatePath(keyPath); err != nil {
 		return nil, "", err
 	}
 
-	keys := SplitPath(keyPath)
-	
 	dataMap, ok := data.(map[string]interface{})
 	if !ok {
 		return nil, "", fmt.Errorf("%w: Root data is not an object", ErrPathError)
 	}
 
-	if len(keys) == 1 {
+	if strings.IndexByte(keyPath, '.') < 0 {
 		// Key is at root level
-		return dataMap, keys[0], nil
+		return dataMap, keyPath, nil
 	}
 
-	// Navigate to parent
-	parentPath := strings.Join(keys[:len(keys)-1], ".")
-	parent, err := NavigateToKey(data, parentPath)
-	if err != nil {
+	if err := validateSegments(keyPath); err != nil {
 		return nil, "", err
 	}
+	keys := compilePath(keyPath)
+
+	// Navigate to parent. Segments are split on every dot, so the parent path
+	// is a prefix of keyPath and needs no re-join or re-split.
+	parentKeys := keys[:len(keys)-1]
+	parentPath := keyPath[:strings.LastIndexByte(keyPath, '.')]
+	parent, exists := dataMap[parentPath]
+	if !exists {
+		var err error
+		if parent, err = navigateKeys(data, parentPath, parentKeys); err != nil {
+			return nil, "", err
+		}
+	}
 
 	parentMap, ok := parent.(map[string]interface{})
 	if !ok {
@@ -104,23 +311,49 @@ func NavigateToParent(data interface{}, keyPath string) (map[string]interface{},
 
 // KeyExists checks if a key path exists in the data structure
 func KeyExists(data interface{}, keyPath string) bool {
-	if err := ValidatePath(keyPath); err != nil {
-		return false
+	_, _, found := LocateKey(data, keyPath)
+	return found
+}
+
+// LocateKey finds the object holding the value at keyPath and the key it is
+// stored under, using the same rules as NavigateToKey. Nothing is allocated
+// on a miss, so callers can check and modify a key with a single walk.
+func LocateKey(data interface{}, keyPath string) (map[string]interface{}, string, bool) {
+	if keyPath == "" {
+		return nil, "", false
 	}
 
 	dataMap, ok := data.(map[string]interface{})
 	if !ok {
-		return false
+		return nil, "", false
 	}
 
 	// First, try the whole path as a single key (handles keys with dots)
 	if _, exists := dataMap[keyPath]; exists {
-		return true
+		return dataMap, keyPath, true
+	}
+
+	if strings.IndexByte(keyPath, '.') < 0 || hasEmptySegment(keyPath) {
+		return nil, "", false
 	}
 
 	// If that fails, try dot-separated navigation
-	_, err := NavigateToKey(data, keyPath)
-	return err == nil
+	keys := compilePath(keyPath)
+	parent, _, found := walkKeys(data, keys[:len(keys)-1])
+	if !found {
+		return nil, "", false
+	}
+
+	parentMap, ok := parent.(map[string]interface{})
+	if !ok {
+		return nil, "", false
+	}
+
+	finalKey := keys[len(keys)-1]
+	if _, exists := parentMap[finalKey]; !exists {
+		return nil, "", false
+	}
+	return parentMap, finalKey, true
 }
 
 // CreateNestedPath creates nested path structure, creating intermediate objects as needed
@@ -128,8 +361,11 @@ func CreateNestedPath(data map[string]interface{}, keyPath string) (map[string]i
 	if err := ValidatePath(keyPath); err != nil {
 		return nil, err
 	}
+	if err := validateSegments(keyPath); err != nil {
+		return nil, err
+	}
 
-	keys := SplitPath(keyPath)
+	keys := compilePath(keyPath)
 	
 	if len(keys) == 1 {
 		// Root level key
@@ -201,6 +437,11 @@ func RemoveKeyAtPath(data map[string]interface{}, keyPath string) (interface{},
 		return value, nil
 	}
 
+	// A root-level key was settled by the lookup above
+	if strings.IndexByte(keyPath, '.') < 0 {
+		return nil, fmt.Errorf("%w: Key '%s' not found", ErrKeyNotFound, keyPath)
+	}
+
 	// If that fails, try dot-separated navigation
 	parent, finalKey, err := NavigateToParent(data, keyPath)
 	if err != nil {
@@ -216,6 +457,35 @@ func RemoveKeyAtPath(data map[string]interface{}, keyPath string) (interface{},
 	return value, nil
 }
 
+// AddValueAtPath stores value at a key path that must not exist yet,
+// creating intermediate objects as needed. The existence check and the write
+// share one walk; nothing is created when the key already exists.
+func AddValueAtPath(data map[string]interface{}, keyPath string, value interface{}) error {
+	if err := ValidatePath(keyPath); err != nil {
+		return err
+	}
+
+	// A root key matching the whole path counts as existing (keys with dots)
+	if _, exists := data[keyPath]; exists {
+		return fmt.Errorf("%w: Key '%s' already exists", ErrKeyExists, keyPath)
+	}
+
+	// Every intermediate object of an existing key already exists, so this
+	// only creates objects when the key is really absent
+	parent, err := CreateNestedPath(data, keyPath)
+	if err != nil {
+		return err
+	}
+
+	finalKey := keyPath[strings.LastIndexByte(keyPath, '.')+1:]
+	if _, exists := parent[finalKey]; exists {
+		return fmt.Errorf("%w: Key '%s' already exists", ErrKeyExists, keyPath)
+	}
+
+	parent[finalKey] = value
+	return nil
+}
+
 // SetValueAtPath sets a value at the specified path
 func SetValueAtPath(data map[string]interface{}, keyPath string, value interface{}, createPath bool) error {
 	var parent map[string]interface{}
@@ -227,7 +497,8 @@ func SetValueAtPath(data map[string]interface{}, keyPath string, value interface
 		if err != nil {
 			return err
 		}
-		finalKey = SplitPath(keyPath)[len(SplitPath(keyPath))-1]
+		// The final segment follows the last dot; no need to split again
+		finalKey = keyPath[strings.LastIndexByte(keyPath, '.')+1:]
 	} else {
 		parent, finalKey, err = NavigateToParent(data, keyPath)
 		if err != nil {
@@ -1,6 +1,8 @@
 package pathresolver
 
 import (
+	"errors"
+	"strings"
 	"testing"
 )
 
@@ -13,6 +15,8 @@ func TestValidatePath(t *testing.T) {
 		{"valid simple path", "key", false},
 		{"valid nested path", "section.subsection.key", false},
 		{"empty path", "", true},
+		// May name a root key literally; checked again before navigation
+		{"trailing dots", "Loading...", false},
 	}
 
 	for _, tt := range tests {
@@ -25,6 +29,29 @@ func TestValidatePath(t *testing.T) {
 	}
 }
 
+func TestValidateSegments(t *testing.T) {
+	tests := []struct {
+		name    string
+		path    string
+		wantErr bool
+	}{
+		{"valid nested path", "section.subsection.key", false},
+		{"leading dot", ".key", true},
+		{"trailing dot", "key.", true},
+		{"empty middle segment", "section..key", true},
+		{"single dot", ".", true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			err := validateSegments(tt.path)
+			if (err != nil) != tt.wantErr {
+				t.Errorf("validateSegments() error = %v, wantErr %v", err, tt.wantErr)
+			}
+		})
+	}
+}
+
 func TestSplitPath(t *testing.T) {
 	tests := []struct {
 		name string
@@ -52,6 +79,25 @@ func TestSplitPath(t *testing.T) {
 	}
 }
 
+func TestCompilePath(t *testing.T) {
+	first := compilePath("dashboard.stats.users")
+	want := []string{"dashboard", "stats", "users"}
+	if len(first) != len(want) {
+		t.Fatalf("compilePath() = %v, want %v", first, want)
+	}
+	for i, v := range first {
+		if v != want[i] {
+			t.Errorf("compilePath()[%d] = %v, want %v", i, v, want[i])
+		}
+	}
+
+	// Repeated compilation should return the memoized slice
+	second := compilePath("dashboard.stats.users")
+	if &first[0] != &second[0] {
+		t.Error("compilePath() should reuse the cached segments")
+	}
+}
+
 func TestNavigateToKey(t *testing.T) {
 	testData := map[string]interface{}{
 		"simple": "value",
@@ -59,6 +105,7 @@ func TestNavigateToKey(t *testing.T) {
 			"key": "nested value",
 		},
 		"key.with.dots": "dotted key value",
+		"Loading...":    "Loading...",
 		"dashboard": map[string]interface{}{
 			"title": "Dashboard",
 			"stats": map[string]interface{}{
@@ -78,6 +125,8 @@ func TestNavigateToKey(t *testing.T) {
 		{"nested key", testData, "nested.key", "nested value", false},
 		{"deeply nested", testData, "dashboard.stats.users", "Total Users", false},
 		{"key with dots", testData, "key.with.dots", "dotted key value", false},
+		{"literal key with empty segments", testData, "Loading...", "Loading...", false},
+		{"empty segment", testData, "dashboard..title", nil, true},
 		{"nonexistent key", testData, "nonexistent", nil, true},
 		{"nonexistent nested", testData, "dashboard.nonexistent", nil, true},
 		{"empty path", testData, "", nil, true},
@@ -98,6 +147,154 @@ func TestNavigateToKey(t *testing.T) {
 	}
 }
 
+func TestNavigateToParent(t *testing.T) {
+	data := map[string]interface{}{
+		"user": map[string]interface{}{
+			"profile": map[string]interface{}{
+				"name": "John",
+			},
+		},
+		"user.settings": map[string]interface{}{
+			"theme": "dark",
+		},
+		"title": "Hello",
+	}
+
+	tests := []struct {
+		name       string
+		keyPath    string
+		wantParent []string
+		wantKey    string
+		wantErr    error
+	}{
+		{"root level key", "title", []string{"user", "user.settings", "title"}, "title", nil},
+		{"nested key", "user.profile.name", []string{"name"}, "name", nil},
+		{"literal dotted parent", "user.settings.theme", []string{"theme"}, "theme", nil},
+		{"missing parent", "user.missing.name", nil, "", ErrKeyNotFound},
+		{"non-object parent", "title.sub.key", nil, "", ErrPathError},
+		{"empty path", "", nil, "", ErrInvalidPath},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			parent, key, err := NavigateToParent(data, tt.keyPath)
+			if tt.wantErr != nil {
+				if !errors.Is(err, tt.wantErr) {
+					t.Errorf("NavigateToParent() error = %v, want %v", err, tt.wantErr)
+				}
+				return
+			}
+			if err != nil {
+				t.Fatalf("NavigateToParent() error = %v", err)
+			}
+			if key != tt.wantKey {
+				t.Errorf("NavigateToParent() key = %s, want %s", key, tt.wantKey)
+			}
+			if len(parent) != len(tt.wantParent) {
+				t.Errorf("NavigateToParent() parent has %d keys, want %d", len(parent), len(tt.wantParent))
+			}
+			for _, k := range tt.wantParent {
+				if _, ok := parent[k]; !ok {
+					t.Errorf("NavigateToParent() parent missing key %s", k)
+				}
+			}
+		})
+	}
+}
+
+func TestStreamToKey(t *testing.T) {
+	document := `{
+		"simple": "value",
+		"nested": {"key": "nested value", "list": [1, 2]},
+		"key.with.dots": "dotted key value",
+		"Loading...": "Loading...",
+		"dashboard": {"stats": {"users": "Total Users"}},
+		"duplicate": "first",
+		"duplicate": "second"
+	}`
+
+	tests := []struct {
+		name      string
+		path      string
+		want      string
+		wantFound bool
+		wantErr   bool
+	}{
+		{"simple key", "simple", `"value"`, true, false},
+		{"nested key", "nested.key", `"nested value"`, true, false},
+		{"nested array", "nested.list", `[1, 2]`, true, false},
+		{"deeply nested", "dashboard.stats.users", `"Total Users"`, true, false},
+		{"key with dots", "key.with.dots", `"dotted key value"`, true, false},
+		{"last duplicate wins", "duplicate", `"second"`, true, false},
+		{"literal key with empty segments", "Loading...", `"Loading..."`, true, false},
+		{"empty segment", "nested..key", "", false, false},
+		{"nonexistent key", "nonexistent", "", false, false},
+		{"nonexistent nested", "dashboard.nonexistent", "", false, false},
+		{"navigate through non-object", "simple.invalid", "", false, false},
+		{"empty path", "", "", false, true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			raw, found, err := StreamToKey(strings.NewReader(document), tt.path)
+			if (err != nil) != tt.wantErr {
+				t.Errorf("StreamToKey() error = %v, wantErr %v", err, tt.wantErr)
+				return
+			}
+			if found != tt.wantFound {
+				t.Errorf("StreamToKey() found = %v, want %v", found, tt.wantFound)
+				return
+			}
+			if found && string(raw) != tt.want {
+				t.Errorf("StreamToKey() = %s, want %s", raw, tt.want)
+			}
+		})
+	}
+}
+
+func TestStreamToKeyInvalidJSON(t *testing.T) {
+	_, found, err := StreamToKey(strings.NewReader(`{"simple": "value"} trailing`), "simple")
+	if err == nil || found {
+		t.Errorf("StreamToKey() should reject trailing data, got found=%v err=%v", found, err)
+	}
+
+	_, found, err = StreamToKey(strings.NewReader(`{"simple": `), "simple")
+	if err == nil || found {
+		t.Errorf("StreamToKey() should reject truncated JSON, got found=%v err=%v", found, err)
+	}
+}
+
+func TestLocateValue(t *testing.T) {
+	document := `{"simple": "value", "nested": {"key": [1, 2]}, "key.with.dots": true}`
+
+	tests := []struct {
+		name   string
+		path   string
+		want   string
+		wantOK bool
+	}{
+		{"simple key", "simple", `"value"`, true},
+		{"nested value", "nested.key", `[1, 2]`, true},
+		{"literal dotted key", "key.with.dots", "true", true},
+		{"nonexistent key", "nested.missing", "", false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			offset, length, ok, err := LocateValue(strings.NewReader(document), tt.path)
+			if err != nil {
+				t.Fatalf("LocateValue() error = %v", err)
+			}
+			if ok != tt.wantOK {
+				t.Fatalf("LocateValue() ok = %v, want %v", ok, tt.wantOK)
+			}
+			if ok && document[offset:offset+length] != tt.want {
+				t.Errorf("LocateValue() range = %q, want %q", document[offset:offset+length], tt.want)
+			}
+		})
+	}
+}
+
 func TestKeyExists(t *testing.T) {
 	testData := map[string]interface{}{
 		"simple": "value",
@@ -105,6 +302,7 @@ func TestKeyExists(t *testing.T) {
 			"key": "nested value",
 		},
 		"key.with.dots": "dotted key value",
+		"Loading...":    "Loading...",
 	}
 
 	tests := []struct {
@@ -116,8 +314,12 @@ func TestKeyExists(t *testing.T) {
 		{"existing simple key", testData, "simple", true},
 		{"existing nested key", testData, "nested.key", true},
 		{"existing key with dots", testData, "key.with.dots", true},
+		{"literal key with empty segments", testData, "Loading...", true},
+		{"empty segment", testData, "nested..key", false},
 		{"nonexistent key", testData, "nonexistent", false},
 		{"nonexistent nested", testData, "nested.nonexistent", false},
+		{"through non-object value", testData, "simple.key", false},
+		{"non-object root", []interface{}{"simple"}, "simple", false},
 		{"empty path", testData, "", false},
 	}
 
@@ -131,6 +333,48 @@ func TestKeyExists(t *testing.T) {
 	}
 }
 
+func TestLocateKey(t *testing.T) {
+	nested := map[string]interface{}{
+		"key": "nested value",
+	}
+	testData := map[string]interface{}{
+		"simple":        "value",
+		"nested":        nested,
+		"key.with.dots": "dotted key value",
+		"Loading...":    "Loading...",
+	}
+
+	tests := []struct {
+		name       string
+		path       string
+		wantParent map[string]interface{}
+		wantKey    string
+		wantFound  bool
+	}{
+		{"simple key", "simple", testData, "simple", true},
+		{"nested key", "nested.key", nested, "key", true},
+		{"key with dots", "key.with.dots", testData, "key.with.dots", true},
+		{"literal key with empty segments", "Loading...", testData, "Loading...", true},
+		{"empty segment", "nested..key", nil, "", false},
+		{"missing final key", "nested.missing", nil, "", false},
+		{"missing parent", "missing.key", nil, "", false},
+		{"through non-object value", "simple.key", nil, "", false},
+		{"empty path", "", nil, "", false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			parent, key, found := LocateKey(testData, tt.path)
+			if found != tt.wantFound || key != tt.wantKey {
+				t.Fatalf("LocateKey() = (%v, %v), want (%v, %v)", key, found, tt.wantKey, tt.wantFound)
+			}
+			if found && parent[key] != tt.wantParent[tt.wantKey] {
+				t.Errorf("LocateKey() parent holds %v, want %v", parent[key], tt.wantParent[tt.wantKey])
+			}
+		})
+	}
+}
+
 func TestCreateNestedPath(t *testing.T) {
 	tests := []struct {
 		name    string
@@ -257,7 +501,10 @@ func TestRemoveKeyAtPath(t *testing.T) {
 	}{
 		{"existing simple key", "simple", false},
 		{"existing nested key", "nested.key", false},
+		{"literal key with empty segments", "Loading...", false},
 		{"nonexistent key", "nonexistent", true},
+		{"nonexistent nested key", "nested.missing", true},
+		{"empty segment", "nested..key", true},
 		{"empty path", "", true},
 	}
 
@@ -268,6 +515,7 @@ func TestRemoveKeyAtPath(t *testing.T) {
 				"nested": map[string]interface{}{
 					"key": "nested value",
 				},
+				"Loading...": "Loading...",
 			}
 
 			_, err := RemoveKeyAtPath(data, tt.path)
@@ -278,6 +526,56 @@ func TestRemoveKeyAtPath(t *testing.T) {
 	}
 }
 
+func TestAddValueAtPath(t *testing.T) {
+	tests := []struct {
+		name    string
+		path    string
+		wantErr error
+	}{
+		{"add root key", "fresh", nil},
+		{"add nested key with new parents", "new.nested.key", nil},
+		{"add into existing object", "nested.other", nil},
+		{"existing nested key", "nested.key", ErrKeyExists},
+		{"existing key with dots", "key.with.dots", ErrKeyExists},
+		{"existing literal key with empty segments", "Loading...", ErrKeyExists},
+		{"empty segment", "nested..other", ErrInvalidPath},
+		{"through non-object value", "simple.key", ErrPathConflict},
+		{"empty path", "", ErrInvalidPath},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			data := map[string]interface{}{
+				"simple": "value",
+				"nested": map[string]interface{}{
+					"key": "nested value",
+				},
+				"key.with.dots": "dotted key value",
+				"Loading...":    "Loading...",
+			}
+
+			err := AddValueAtPath(data, tt.path, "added")
+			if tt.wantErr != nil {
+				if !errors.Is(err, tt.wantErr) {
+					t.Errorf("AddValueAtPath() error = %v, want %v", err, tt.wantErr)
+				}
+				if len(data) != 4 {
+					t.Errorf("AddValueAtPath() modified data on failure: %v", data)
+				}
+				return
+			}
+			if err != nil {
+				t.Fatalf("AddValueAtPath() error = %v", err)
+			}
+
+			got, err := NavigateToKey(data, tt.path)
+			if err != nil || got != "added" {
+				t.Errorf("NavigateToKey() after AddValueAtPath() = %v, %v, want 'added'", got, err)
+			}
+		})
+	}
+}
+
 func TestSetValueAtPath(t *testing.T) {
 	tests := []struct {
 		name       string
@@ -289,6 +587,7 @@ func TestSetValueAtPath(t *testing.T) {
 		{"set existing key", "existing", "new value", false, false},
 		{"set with create path", "new.nested.key", "created value", true, false},
 		{"set without create path", "nonexistent.key", "value", false, true},
+		{"set root key with create path", "root", "root value", true, false},
 	}
 
 	for _, tt := range tests {
@@ -301,6 +600,14 @@ func TestSetValueAtPath(t *testing.T) {
 			if (err != nil) != tt.wantErr {
 				t.Errorf("SetValueAtPath() error = %v, wantErr %v", err, tt.wantErr)
 			}
+			if err != nil {
+				return
+			}
+
+			got, err := NavigateToKey(data, tt.path)
+			if err != nil || got != tt.value {
+				t.Errorf("NavigateToKey() after SetValueAtPath() = %v, %v, want %v", got, err, tt.value)
+			}
 		})
 	}
 }
@@ -308,4 +615,4 @@ func TestSetValueAtPath(t *testing.T) {
 // Helper function to create string pointer
 func stringPtr(s string) *string {
 	return &s
-}
\ No newline at end of file
+}